@@ -21,7 +21,8 @@ TYPE_MAPPING = {
     "wstring": "std::u16string",
 }
 
-STRING_TYPES = ["std::string", "std::u16string"]
+# C++ string types among the TYPE_MAPPING values (a set, for membership tests)
+STRING_TYPES = frozenset({"std::string", "std::u16string"})
 
 
 class Colors:
@@ -21,7 +21,10 @@ from packaging.specifiers import InvalidSpecifier
 # Import globals, constants, and utilities
 from commands import globals as g
 from commands.constants import Colors
-from commands.utils import load_configuration
+from commands.utils import load_configuration, load_yaml
+
+# Owner and repository name from an SSH GitHub URL
+_GIT_URL_RE = re.compile(r"git@github.com:(.*)/(.*)\.git")
 
 
 def index_release_command(package_name=None):
@@ -82,7 +85,7 @@ def list_all_available_packages():
             return package_name, ["(No repository URL found)"]
 
         git_url = repo_info["url"]
-        match = re.search(r"git@github.com:(.*)/(.*)\.git", git_url)
+        match = _GIT_URL_RE.search(git_url)
         if not match:
             return package_name, ["(Could not parse repository URL)"]
 
@@ -212,7 +215,7 @@ def list_github_release_versions(package_name):
 
     # Parse Owner/Repo from URL
     git_url = repo_info["url"]
-    match = re.search(r"git@github.com:(.*)/(.*)\.git", git_url)
+    match = _GIT_URL_RE.search(git_url)
     if not match:
         print(f"❌ Error: Could not parse GitHub owner/repo from URL '{git_url}'.")
         return
@@ -407,8 +410,7 @@ def parse_package_yaml(
         A tuple: (package_name, version_string, raw_deps_list_or_None)
     """
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(yaml_path)
 
         if not isinstance(data, dict):
             return (pkg_name, "ERROR", ["Invalid or empty YAML"])
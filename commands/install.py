@@ -10,14 +10,20 @@ import click
 from pathlib import Path
 import requests
 import zipfile
-import yaml
 from packaging.version import parse as parse_version
 from packaging.version import InvalidVersion
 from packaging.specifiers import SpecifierSet
 
 # Import globals and utilities
 from commands import globals as g
-from commands.utils import load_configuration
+from commands.utils import load_configuration, load_yaml
+
+# A target specifier such as "my-plugin>=1.2": package name, then version constraints
+_TARGET_SPEC_RE = re.compile(r"^\s*([a-zA-Z0-9_.-]+)\s*(.*)\s*$")
+_SPECIFIER_RE = re.compile(r"[<>=!~]+[\d.]+")
+
+# Owner and repository name from an SSH GitHub URL
+_GIT_URL_RE = re.compile(r"git@github.com:(.*)/(.*)\.git")
 
 
 def install_command(targets, build_type):
@@ -65,7 +71,7 @@ def install_command(targets, build_type):
     while install_queue:
         target_spec = install_queue.pop(0)
 
-        match = re.match(r"^\s*([a-zA-Z0-9_.-]+)\s*(.*)\s*$", target_spec)
+        match = _TARGET_SPEC_RE.match(target_spec)
         if not match:
             print(
                 f"⚠️ Warning: Could not parse target specifier '{target_spec}'. Skipping."
@@ -79,7 +85,7 @@ def install_command(targets, build_type):
             if not spec_str:
                 spec = SpecifierSet(">=0.0.0")
             else:
-                specifiers_list = re.findall(r"[<>=!~]+[\d.]+", spec_str)
+                specifiers_list = _SPECIFIER_RE.findall(spec_str)
                 formatted_spec_str = ", ".join(specifiers_list)
                 formatted_spec_str = formatted_spec_str.replace(">, =", ">=")
                 spec = SpecifierSet(formatted_spec_str)
@@ -101,22 +107,21 @@ def install_command(targets, build_type):
                 if not spec_str:
                     is_valid = True
             else:
-                with open(release_yaml_path, "r") as f:
-                    release_info = yaml.safe_load(f) or {}
-                    version_str = release_info.get("version")
-                    dependencies = release_info.get("dependencies", [])
-                    if not version_str:
-                        if not spec_str:
+                release_info = load_yaml(release_yaml_path) or {}
+                version_str = release_info.get("version")
+                dependencies = release_info.get("dependencies", [])
+                if not version_str:
+                    if not spec_str:
+                        is_valid = True
+                else:
+                    try:
+                        version_obj = parse_version(version_str)
+                        if spec.contains(version_obj):
                             is_valid = True
-                    else:
-                        try:
-                            version_obj = parse_version(version_str)
-                            if spec.contains(version_obj):
-                                is_valid = True
-                        except InvalidVersion:
-                            print(
-                                f"⚠️ Invalid version '{version_str}' in {package_type} release.yaml. Ignoring."
-                            )
+                    except InvalidVersion:
+                        print(
+                            f"⚠️ Invalid version '{version_str}' in {package_type} release.yaml. Ignoring."
+                        )
             if is_valid:
                 if dependencies:
                     install_queue.extend(dependencies)
@@ -151,7 +156,7 @@ def install_command(targets, build_type):
             continue
 
         git_url = repo_info["url"]
-        match = re.search(r"git@github.com:(.*)/(.*)\.git", git_url)
+        match = _GIT_URL_RE.search(git_url)
         if not match:
             print(f"❌ Error: Could not parse GitHub owner/repo from URL '{git_url}'.")
             is_successful = False
@@ -261,11 +266,10 @@ def install_command(targets, build_type):
 
             release_yaml_path = install_dir / "release.yaml"
             if release_yaml_path.is_file():
-                with open(release_yaml_path, "r") as f:
-                    release_info = yaml.safe_load(f)
-                    dependencies = release_info.get("dependencies", [])
-                    if dependencies:
-                        install_queue.extend(dependencies)
+                release_info = load_yaml(release_yaml_path)
+                dependencies = release_info.get("dependencies", [])
+                if dependencies:
+                    install_queue.extend(dependencies)
 
         except Exception as e:
             print(f"❌ An error occurred while processing '{package_name}': {e}")
@@ -10,6 +10,7 @@ import sys
 import json
 import yaml
 import shutil
+import zipfile
 import platform
 import subprocess
 import click
@@ -17,13 +18,47 @@ from pathlib import Path
 
 # Import globals and utilities
 from commands import globals as g
-from commands.utils import load_configuration
+from commands.utils import load_configuration, yaml_load
 from commands.setup import (
     setup,
     get_commit_hash,
     guard_require_version_bump_for_src_packages,
 )
 
+# Archive members that are already compressed; deflating them again only costs time
+_STORED_SUFFIXES = frozenset(
+    {".zip", ".gz", ".tgz", ".xz", ".bz2", ".zst", ".7z", ".png", ".jpg", ".jpeg"}
+)
+
+
+def _make_release_archive(archive_path, root_dir):
+    """
+    Zip the contents of root_dir into archive_path, laid out like
+    shutil.make_archive(..., "zip", root_dir) but without deflating members
+    that are already compressed.
+    """
+    with zipfile.ZipFile(
+        archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6
+    ) as zf:
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            arcdirpath = os.path.normpath(os.path.relpath(dirpath, root_dir))
+            for name in sorted(dirnames):
+                zf.write(os.path.join(dirpath, name), os.path.join(arcdirpath, name))
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if not os.path.isfile(path):
+                    continue
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if os.path.splitext(name)[1].lower() in _STORED_SUFFIXES
+                    else None
+                )
+                zf.write(
+                    path,
+                    os.path.join(arcdirpath, name),
+                    compress_type=compress_type,
+                )
+
 
 def publish(target, build_type):
     """
@@ -53,7 +88,7 @@ def publish(target, build_type):
 
     try:
         with open(release_file_path, "r") as file:
-            details = yaml.safe_load(file)
+            details = yaml_load(file)
             repositories, secrets_config, user_type, _ = load_configuration()
 
             print(f"\n--- Setting up build for '{target}' ---")
@@ -143,9 +178,7 @@ def publish(target, build_type):
             release_dir = Path(g.script_directory) / "release"
             archive_file = release_dir / archive_name_base
             print(f"📦 Compressing '{install_dir}'...")
-            shutil.make_archive(
-                base_name=str(archive_file), format="zip", root_dir=str(install_dir)
-            )
+            _make_release_archive(str(archive_file) + ".zip", str(install_dir))
             print(f"✅ Successfully created archive: {archive_file}.zip")
 
             repositories, secrets, _, _ = load_configuration()
@@ -318,7 +351,9 @@ def publish(target, build_type):
         )
         sys.exit(1)
     except subprocess.CalledProcessError as e:
-        print(f"❌ A command failed with exit code {e.returncode}:\n{e.stderr}")
+        # CMake and Ninja stream straight to the terminal, so only the gh calls
+        # have captured output to show here
+        print(f"❌ A command failed with exit code {e.returncode}:\n{e.stderr or ''}")
         sys.exit(1)
     except yaml.YAMLError as e:
         print(f"🔥 Error parsing YAML file: {e}")
@@ -8,20 +8,95 @@ import os
 import re
 import sys
 import glob
+import heapq
+import hashlib
+import json
+import mmap
 import yaml
+import fnmatch
 import shutil
 import platform
+import functools
+import importlib.util
 import subprocess
+import threading
+import time
+import concurrent.futures
 import requests
 import click
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from packaging.version import parse as parse_version
 from pathlib import Path
-from collections import defaultdict
+from itertools import chain
+from collections import defaultdict, deque
 from typing import List, Tuple, Dict, Any, Set, Optional
 
 # Import globals, constants, and utilities
 from commands import globals as g
 from commands.constants import Colors, TYPE_MAPPING, STRING_TYPES
-from commands.utils import load_configuration, delete_directory
+from commands.utils import (
+    load_configuration,
+    load_yaml,
+    delete_directory,
+    is_root,
+    read_os_release,
+)
+from commands.git_commands import get_display_width
+
+# Worker count for thread pools doing file I/O; threads mostly wait on syscalls,
+# so use more of them than there are cores
+_IO_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Worker count for per-package lookups (GitHub API calls, git subprocesses); kept
+# small so the release queries stay clear of GitHub's secondary rate limits
+_LOOKUP_WORKERS = 8
+
+# An interface definition line without surrounding whitespace and trailing comment
+_FIELD_RE = re.compile(r"^\s*([^\s#][^#]*?)\s*(?:#.*)?$")
+
+# C++ types produced by TYPE_MAPPING, as a set for O(1) membership tests
+_TYPE_MAPPING_VALUES = frozenset(TYPE_MAPPING.values())
+
+# Template placeholder, e.g. "@@MESSAGE_NAME@@"
+_PLACEHOLDER_RE = re.compile(r"@@([A-Z0-9_]+)@@")
+
+# "raisin_find_package(SOMETHING)" calls in a CMakeLists.txt
+_RAISIN_FIND_PACKAGE_RE = re.compile(r"raisin_find_package\((.*?)\)")
+_RAISIN_FIND_PACKAGE_BYTES_RE = re.compile(rb"raisin_find_package\((.*?)\)")
+# Files at least this large are scanned through mmap instead of being read
+_MMAP_MIN_SIZE = 64 * 1024
+
+# find_package keywords (in capital letters) that are not package names
+_FIND_PACKAGE_KEYWORDS = (
+    "REQUIRED",
+    "VERSION",
+    "CONFIG",
+    "COMPONENTS",
+    "QUIET",
+    "EXACT",
+)
+
+# Fixed-size array field type, e.g. "float64[3]"
+_FIXED_ARRAY_RE = re.compile(r"([a-zA-Z0-9_]+)\[(\d+)\]")
+
+# "major.minor" part of the VERSION entry in /etc/os-release
+_VERSION_RE = re.compile(r"(\d+\.\d+)")
+
+# Full or abbreviated git commit hash in a release body
+_SHA_RE = re.compile(r"\b[0-9a-f]{7,40}\b", re.IGNORECASE)
+
+# Plain semantic-version release tag, e.g. "v1.2.3"
+_SEMVER_TAG_RE = re.compile(r"v?(\d+)\.(\d+)\.(\d+)$")
+
+# Top-level "version: x.y.z" entry of a release.yaml, optionally quoted
+_RELEASE_VERSION_RE = re.compile(
+    rb"^version[ \t]*:[ \t]*[\"']?([^\"'\s#][^\"'\r\n#]*)", re.MULTILINE
+)
+
+# owner/repo of a GitHub remote, as git@github.com:o/r.git or https://github.com/o/r
+_GH_SSH_RE = re.compile(r"git@github\.com:([^/]+)/([^/]+?)\.git")
+_GH_HTTPS_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$")
 
 
 # ============================================================================
@@ -66,38 +141,223 @@ def process_build_targets(targets):
 
     # Check if targets specify a directory path
     if len(targets) > 1 and (Path(script_directory) / "src" / targets[0]).exists():
-        g.build_pattern = [
-            name
-            for name in os.listdir(Path(script_directory) / "src" / targets[0])
-            if os.path.isdir(
-                os.path.join(Path(script_directory) / "src" / targets[0], name)
-            )
-        ]
+        with os.scandir(Path(script_directory) / "src" / targets[0]) as it:
+            g.build_pattern = [e.name for e in it if e.is_dir()]
     else:
         all_build_maps = {}
-        yaml_search_path = os.path.join(
-            script_directory, "src", "**", "RAISIN_BUILD_TARGETS.yaml"
-        )
-
-        for filepath in glob.glob(yaml_search_path, recursive=True):
-            with open(filepath, "r") as f:
-                try:
-                    yaml_content = yaml.safe_load(f)
+        for root, dirs, files in os.walk(
+            os.path.join(script_directory, "src"), followlinks=True
+        ):
+            # Skip hidden directories such as .git, as the '**' glob did
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            if "RAISIN_BUILD_TARGETS.yaml" not in files:
+                continue
+            filepath = os.path.join(root, "RAISIN_BUILD_TARGETS.yaml")
+            try:
+                # A file may hold several '---' separated documents
+                for yaml_content in load_yaml(filepath, all_documents=True):
                     if yaml_content:
                         all_build_maps.update(yaml_content)
-                except yaml.YAMLError as e:
-                    click.echo(
-                        f"Warning: Could not parse YAML file {filepath}. Error: {e}",
-                        err=True,
-                    )
+            except yaml.YAMLError as e:
+                click.echo(
+                    f"Warning: Could not parse YAML file {filepath}. Error: {e}",
+                    err=True,
+                )
 
         # Collect build patterns based on the input targets
-        found_patterns = []
-        for target in targets:
-            patterns_for_target = all_build_maps.get(target, [])
-            found_patterns.extend(patterns_for_target)
+        g.build_pattern = list(
+            chain.from_iterable(all_build_maps.get(target, ()) for target in targets)
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_snake(name):
+    """
+    Convert a CamelCase interface or field name to snake_case in a single scan.
+
+    An underscore is inserted before an upper-case letter that follows a lower-case
+    letter or a digit, or that starts a new word (e.g. 'HTTPRequest' -> 'http_request').
+    """
+    if not name or name.islower():
+        return name.replace("__", "_")
+    words = []
+    start = 0
+    last = len(name) - 1
+    for i in range(1, last + 1):
+        if "A" <= name[i] <= "Z":
+            prev = name[i - 1]
+            if (
+                "a" <= prev <= "z"
+                or "0" <= prev <= "9"
+                or (i < last and "a" <= name[i + 1] <= "z")
+            ):
+                words.append(name[start:i])
+                start = i
+    words.append(name[start:])
+    snake = "_".join(words).lower()
+    # Only an underscore already in the name can end up doubled
+    return snake.replace("__", "_") if "_" in name else snake
+
+
+@functools.lru_cache(maxsize=4096)
+def _msg_include(subproject_path, message_type):
+    """
+    Return the #include line for a message type used as a field, relative to
+    a generated header. Field types repeat across interfaces, so lines are cached.
+    """
+    return f'#include "../../{subproject_path}/msg/{_to_snake(message_type)}.hpp"'
+
+
+@functools.lru_cache(maxsize=16)
+def _template(name):
+    """
+    Return the contents of <g.script_directory>/templates/<name>.
+    Templates are read from disk once and shared by every generated file.
+    """
+    return Path(g.script_directory, "templates", name).read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=16)
+def _split_template(template_content):
+    """
+    Split template_content into alternating literal text and placeholder names,
+    so each template is scanned for @@NAME@@ only once.
+    """
+    return tuple(_PLACEHOLDER_RE.split(template_content))
+
 
-        g.build_pattern = found_patterns
+def _render_template(template_content, values):
+    """
+    Replace every @@NAME@@ placeholder in template_content with values[NAME]
+    in a single pass. Placeholders without a value are left untouched.
+    """
+    parts = list(_split_template(template_content))
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = values.get(name, f"@@{name}@@")
+    return "".join(parts)
+
+
+# Directories already created during this setup run
+_known_dirs = set()
+
+
+def _ensure_dir(path):
+    """
+    os.makedirs(path, exist_ok=True), skipped for directories this run already created.
+    """
+    path = os.fspath(path)
+    if path in _known_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _known_dirs.add(path)
+
+
+# Content hash and mtime of each generated header, as of the previous setup run
+# (previous) and this one (current). Unchanged headers get their old mtime back,
+# so wiping and regenerating 'generated' does not force a full C++ rebuild.
+_generated_manifest = {"previous": {}, "current": {}}
+_generated_manifest_lock = threading.Lock()
+
+
+def _generated_manifest_path():
+    return Path(g.script_directory) / ".raisin_cache" / "generated.json"
+
+
+def _load_generated_manifest():
+    """
+    Start a setup run: load the header manifest written by the previous run.
+    """
+    try:
+        previous = _json_loads(_generated_manifest_path().read_bytes())
+    except (OSError, ValueError):
+        previous = {}
+    _generated_manifest["previous"] = previous
+    _generated_manifest["current"] = {}
+
+
+def _save_generated_manifest():
+    """
+    Persist the headers written during this setup run for the next one.
+    """
+    try:
+        path = _generated_manifest_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(_generated_manifest["current"]))
+    except OSError:
+        pass  # The manifest is only an optimization
+
+
+def _write_generated(output_path, content):
+    """
+    Write a generated header. If its content matches what the previous setup
+    run wrote, restore that run's mtime so build tools see it as unchanged.
+    """
+    with open(output_path, "w") as output_file:
+        output_file.write(content)
+
+    digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    with _generated_manifest_lock:
+        previous = _generated_manifest["previous"].get(output_path)
+        if previous is not None and previous[0] == digest:
+            mtime_ns = previous[1]
+            os.utime(output_path, ns=(mtime_ns, mtime_ns))
+        else:
+            mtime_ns = os.stat(output_path).st_mtime_ns
+        _generated_manifest["current"][output_path] = [digest, mtime_ns]
+
+
+# getSize() contributions of a field, keyed by (is a container, element kind)
+_BUFFER_SIZE_FORMATS = {
+    (True, "string"): "temp += sizeof(uint32_t); \n for (const auto& v : {name}) "
+    "temp += sizeof(uint32_t) + v.size();",
+    (True, "primitive"): "temp += {name}.size() * sizeof({name});",
+    (True, "message"): "for (const auto& v : {name}) temp += v.getSize();",
+    (False, "string"): "temp += sizeof(uint32_t) + {name}.size();",
+    (False, "primitive"): "temp += sizeof({name});",
+    (False, "message"): "temp += {name}.getSize();",
+}
+
+
+def _buffer_size_expression(transformed_type, base_type, data_name):
+    """
+    Return the C++ statement adding a field's serialized size to 'temp'.
+    """
+    is_container = transformed_type.startswith(("std::vector", "std::array"))
+    element_type = base_type if is_container else transformed_type
+    if element_type in STRING_TYPES:
+        kind = "string"
+    elif element_type in _TYPE_MAPPING_VALUES:
+        kind = "primitive"
+    else:
+        kind = "message"
+    return _BUFFER_SIZE_FORMATS[is_container, kind].format(name=data_name)
+
+
+def _buffer_member_strings(buffer_members):
+    """
+    Build the (de)serialization snippets for a list of buffer members in one pass.
+
+    :return: (set, set2, get, equal) strings for the SET_BUFFER_MEMBERS,
+             SET_BUFFER_MEMBERS2, GET_BUFFER_MEMBERS and EQUAL_BUFFER_MEMBERS
+             template placeholders
+    """
+    set_parts = []
+    set2_parts = []
+    get_parts = []
+    equal_parts = []
+    for bm in buffer_members:
+        set_parts.append(f"::raisin::setBuffer(buffer, {bm});\n")
+        set2_parts.append(f"buffer = ::raisin::setBuffer(buffer, {bm});")
+        get_parts.append(f"temp = ::raisin::getBuffer(temp, {bm});\n")
+        equal_parts.append(f"&& this->{bm} == other.{bm} \n")
+
+    return (
+        "".join(set_parts),
+        "\n".join(set2_parts),
+        "".join(get_parts),
+        "".join(equal_parts),
+    )
 
 
 def create_service_file(srv_file, project_directory, install_dir):
@@ -109,8 +369,6 @@ def create_service_file(srv_file, project_directory, install_dir):
     :param project_directory: Path to the project directory
     :param install_dir: Installation directory
     """
-    template_path = os.path.join(g.script_directory, "templates", "ServiceTemplate.hpp")
-
     # Extract the project name from the project directory path
     project_name = os.path.basename(project_directory)
 
@@ -120,25 +378,20 @@ def create_service_file(srv_file, project_directory, install_dir):
     )
 
     # Recreate the directory to ensure it's clean
-    os.makedirs(include_project_srv_dir, exist_ok=True)
+    _ensure_dir(include_project_srv_dir)
 
     destination_file = os.path.join(install_dir, "messages", project_name, "srv", "")
-    os.makedirs(destination_file, exist_ok=True)
+    _ensure_dir(destination_file)
     shutil.copy2(srv_file, destination_file)
 
-    # Read the template
-    with open(template_path, "r") as template_file:
-        template_content = template_file.read()
+    # Read the template (cached across calls)
+    template_content = _template("ServiceTemplate.hpp")
 
     # Extract service name from the file
     service_name = os.path.basename(srv_file).replace(".srv", "")
 
     # Read the service file and split it into request and response parts
-    with open(srv_file, "r") as srv_file_content:
-        srv_content = srv_file_content.read()
-
-    with open(srv_file, "r") as srv_file_content:
-        lines = srv_file_content.readlines()
+    srv_content = Path(srv_file).read_text()
 
     # Split the content into request and response sections
     if "---" in srv_content:
@@ -148,43 +401,6 @@ def create_service_file(srv_file, project_directory, install_dir):
         print(f"Invalid service file format: {srv_file}")
         return
 
-    includes = []
-
-    for line in lines:
-        line = line.strip()
-
-        # Ignore comments by splitting at '#' and taking the part before it
-        line = line.split("#", 1)[0].strip()
-
-        # Skip empty lines
-        if not line or line[0] == "-":
-            continue
-
-        parts = line.split()
-        if len(parts) == 2:
-            data_type, data_name = parts
-
-            # Transform the data type for arrays
-            transformed_type, base_type, subproject_path, found_type = (
-                transform_data_type(data_type, project_name)
-            )
-
-            # Check if the type is a known message type (not a primitive)
-            if not found_type and transformed_type != "Header":
-                # Use the preferred include format with relative path
-                if not subproject_path:
-                    subproject_path = project_name
-
-                snake_str = re.sub(
-                    r"(?<!^)(?=[A-Z][a-z]|(?<=[a-z])[A-Z]|(?<=[0-9])(?=[A-Z]))",
-                    "_",
-                    base_type,
-                ).lower()
-                snake_str = snake_str.replace("__", "_")
-                includes.append(
-                    f'#include "../../{subproject_path}/msg/{snake_str}.hpp"'
-                )
-
     # Process the request and response contents
     request_includes, request_members, request_buffer_members, request_buffer_size = (
         process_service_content(request_content, project_name)
@@ -195,100 +411,59 @@ def create_service_file(srv_file, project_directory, install_dir):
         response_buffer_members,
         response_buffer_size,
     ) = process_service_content(response_content, project_name)
+    # Types used by both request and response are included once
+    includes = dict.fromkeys(request_includes + response_includes)
 
-    # Replace placeholders in the template
     class_name = service_name.replace("_", "")
-    service_content = template_content.replace("@@SERVICE_NAME@@", class_name)
-    service_content = service_content.replace("@@INCLUDE_PATH@@", "\n".join(includes))
-    service_content = service_content.replace(
-        "@@REQUEST_INCLUDES@@", "\n".join(request_includes)
-    )
-    service_content = service_content.replace(
-        "@@REQUEST_MEMBERS@@", "\n  ".join(request_members)
-    )
-
-    request_set_buffer_member_string = ""
-    request_get_buffer_member_string = ""
-    request_equal_buffer_member_string = ""
-    response_set_buffer_member_string = ""
-    response_get_buffer_member_string = ""
-    response_equal_buffer_member_string = ""
-
-    for bm in request_buffer_members:
-        request_set_buffer_member_string += f"::raisin::setBuffer(buffer, {bm});\n"
-        request_get_buffer_member_string += f"temp = ::raisin::getBuffer(temp, {bm});\n"
-        request_equal_buffer_member_string += f"&& this->{bm} == other.{bm} \n"
-
-    for bm in response_buffer_members:
-        response_set_buffer_member_string += f"::raisin::setBuffer(buffer, {bm});\n"
-        response_get_buffer_member_string += (
-            f"temp = ::raisin::getBuffer(temp, {bm});\n"
-        )
-        response_equal_buffer_member_string += f"&& this->{bm} == other.{bm} \n"
-
-    service_content = service_content.replace(
-        "@@REQUEST_SET_BUFFER_MEMBERS@@", request_set_buffer_member_string
-    )
-    modified_request_set_buffer_member_string = "\n".join(
-        "buffer = " + line for line in request_set_buffer_member_string.splitlines()
-    )
-    service_content = service_content.replace(
-        "@@REQUEST_SET_BUFFER_MEMBERS2@@", modified_request_set_buffer_member_string
-    )
-    service_content = service_content.replace(
-        "@@REQUEST_GET_BUFFER_MEMBERS@@", request_get_buffer_member_string
-    )
-    service_content = service_content.replace(
-        "@@REQUEST_EQUAL_BUFFER_MEMBERS@@", request_equal_buffer_member_string
-    )
-    service_content = service_content.replace(
-        "@@REQUEST_BUFFER_SIZE@@", "\n  ".join(request_buffer_size)
-    )
-
-    service_content = service_content.replace(
-        "@@RESPONSE_SET_BUFFER_MEMBERS@@", response_set_buffer_member_string
-    )
-    modified_response_set_buffer_member_string = "\n".join(
-        "buffer = " + line for line in response_set_buffer_member_string.splitlines()
-    )
-    service_content = service_content.replace(
-        "@@RESPONSE_SET_BUFFER_MEMBERS2@@", modified_response_set_buffer_member_string
-    )
-    service_content = service_content.replace(
-        "@@RESPONSE_GET_BUFFER_MEMBERS@@", response_get_buffer_member_string
-    )
-    service_content = service_content.replace(
-        "@@RESPONSE_EQUAL_BUFFER_MEMBERS@@", response_equal_buffer_member_string
-    )
-    service_content = service_content.replace(
-        "@@RESPONSE_BUFFER_SIZE@@", "\n  ".join(response_buffer_size)
-    )
 
-    service_content = service_content.replace(
-        "@@RESPONSE_INCLUDES@@", "\n".join(response_includes)
-    )
-    service_content = service_content.replace(
-        "@@RESPONSE_MEMBERS@@", "\n  ".join(response_members)
-    )
+    (
+        request_set_buffer_member_string,
+        modified_request_set_buffer_member_string,
+        request_get_buffer_member_string,
+        request_equal_buffer_member_string,
+    ) = _buffer_member_strings(request_buffer_members)
+    (
+        response_set_buffer_member_string,
+        modified_response_set_buffer_member_string,
+        response_get_buffer_member_string,
+        response_equal_buffer_member_string,
+    ) = _buffer_member_strings(response_buffer_members)
 
     buffer_member_string = ", ".join(response_buffer_members)
     buffer_member_string = (
         f", {buffer_member_string}" if response_buffer_members else buffer_member_string
     )
-    service_content = service_content.replace(
-        "@@RESPONSE_BUFFER_MEMBERS@@", buffer_member_string
+
+    # Fill in all placeholders of the template in a single pass
+    service_content = _render_template(
+        template_content,
+        {
+            "SERVICE_NAME": class_name,
+            "PROJECT_NAME": project_name,
+            "INCLUDE_PATH": "\n".join(includes),
+            "REQUEST_INCLUDES": "\n".join(request_includes),
+            "REQUEST_MEMBERS": "\n  ".join(request_members),
+            "REQUEST_SET_BUFFER_MEMBERS": request_set_buffer_member_string,
+            "REQUEST_SET_BUFFER_MEMBERS2": modified_request_set_buffer_member_string,
+            "REQUEST_GET_BUFFER_MEMBERS": request_get_buffer_member_string,
+            "REQUEST_EQUAL_BUFFER_MEMBERS": request_equal_buffer_member_string,
+            "REQUEST_BUFFER_SIZE": "\n  ".join(request_buffer_size),
+            "RESPONSE_INCLUDES": "\n".join(response_includes),
+            "RESPONSE_MEMBERS": "\n  ".join(response_members),
+            "RESPONSE_SET_BUFFER_MEMBERS": response_set_buffer_member_string,
+            "RESPONSE_SET_BUFFER_MEMBERS2": modified_response_set_buffer_member_string,
+            "RESPONSE_GET_BUFFER_MEMBERS": response_get_buffer_member_string,
+            "RESPONSE_EQUAL_BUFFER_MEMBERS": response_equal_buffer_member_string,
+            "RESPONSE_BUFFER_SIZE": "\n  ".join(response_buffer_size),
+            "RESPONSE_BUFFER_MEMBERS": buffer_member_string,
+        },
     )
-    service_content = service_content.replace("@@PROJECT_NAME@@", project_name)
 
     # Create the service file in the <g.script_directory>/include/<project_directory>/srv directory
-    snake_str = re.sub(
-        r"(?<!^)(?=[A-Z][a-z]|(?<=[a-z])[A-Z]|(?<=[0-9])(?=[A-Z]))", "_", service_name
-    ).lower()
-    snake_str = snake_str.replace("__", "_")
+    snake_str = _to_snake(service_name)
     output_path = os.path.join(include_project_srv_dir, f"{snake_str}.hpp")
 
-    with open(output_path, "w") as output_file:
-        output_file.write(service_content)
+    _write_generated(output_path, service_content)
 
 
 def process_service_content(content, project_name):
@@ -302,19 +477,16 @@ def process_service_content(content, project_name):
     buffer_size = []
 
     for line in content.splitlines():
-        line = line.strip()
-
-        # Ignore comments
-        line = line.split("#", 1)[0].strip()
-
-        # Skip empty lines
-        if not line:
+        # Strip surrounding whitespace and trailing comments; skip empty lines
+        m = _FIELD_RE.match(line)
+        if not m:
             continue
+        line = m.group(1)
 
         parts = line.split()
-        parts_in_two = line.split(" ", 1)
 
-        if len(parts) < 4 and "=" not in parts_in_two[1]:
+        # Constants carry their '=' after the type, e.g. 'int32 MAX=5'
+        if len(parts) < 4 and "=" not in line.partition(" ")[2]:
             initial_value = ""
             if len(parts) == 3:
                 data_type, data_name, initial_value = parts
@@ -325,19 +497,15 @@ def process_service_content(content, project_name):
             transformed_type, base_type, subproject_path, found_type = (
                 transform_data_type(data_type, project_name)
             )
-            data_name = re.sub(
-                r"(?<!^)(?=[A-Z][a-z]|(?<=[a-z])[A-Z]|(?<=[0-9])(?=[A-Z]))",
-                "_",
-                data_name,
-            ).lower()
-            data_name = data_name.replace("__", "_")
+            data_name = _to_snake(data_name)
 
             # Check if the type is a known message type (not a primitive)
             if not found_type and transformed_type != "Header":
                 # Use the preferred include format with relative path
-                includes.append(
-                    f'#include "../../{subproject_path}/msg/{base_type}.hpp"'
-                )
+                if not subproject_path:
+                    subproject_path = project_name
+
+                includes.append(_msg_include(subproject_path, base_type))
 
             members.append(f"using _{data_name}_type = {transformed_type};")
             if len(parts) == 3:
@@ -347,34 +515,9 @@ def process_service_content(content, project_name):
 
             buffer_members.append(f"{data_name}")
 
-            if transformed_type.startswith(
-                "std::vector"
-            ) or transformed_type.startswith("std::array"):
-                if base_type in STRING_TYPES:
-                    buffer_size.append(
-                        f"temp += sizeof(uint32_t); \n for (const auto& v : {data_name}) temp += sizeof(uint32_t) + v.size();\n"
-                    )
-                elif base_type in TYPE_MAPPING.values():
-                    buffer_size.append(
-                        f"temp += {data_name}.size() * sizeof({data_name});\n"
-                    )
-                else:
-                    buffer_size.append(
-                        f"for (const auto& v : {data_name}) temp += v.getSize();\n"
-                    )
-            else:
-                if transformed_type in STRING_TYPES:
-                    buffer_size.append(
-                        f"temp += sizeof(uint32_t) + {data_name}.size();\n"
-                    )
-                elif (
-                    transformed_type in TYPE_MAPPING.values()
-                    and transformed_type != "std::string"
-                    and transformed_type != "std::u16string"
-                ):
-                    buffer_size.append(f"temp += sizeof({data_name});\n")
-                else:
-                    buffer_size.append(f"temp += {data_name}.getSize();\n")
+            buffer_size.append(
+                _buffer_size_expression(transformed_type, base_type, data_name) + "\n"
+            )
 
         elif "=" in line:
             parts = line.split(" ", 1)
@@ -383,26 +526,62 @@ def process_service_content(content, project_name):
     return includes, members, buffer_members, buffer_size
 
 
+def _find_package_roots(search_path, is_package, packages_to_ignore=()):
+    """
+    Walk search_path top-down, in the same order as os.walk, and return the
+    directories for which is_package(dir_names, file_names) is true.
+    Matching directories and directories named in packages_to_ignore are not
+    descended into.
+    """
+    roots = []
+    stack = [search_path]
+    while stack:
+        root = stack.pop()
+        if os.path.basename(root) in packages_to_ignore:
+            continue
+        dir_names = []
+        file_names = []
+        sub_dirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        dir_names.append(entry.name)
+                        if not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                    else:
+                        file_names.append(entry.name)
+        except OSError:
+            continue
+        if is_package(dir_names, file_names):
+            roots.append(root)
+            continue
+        stack.extend(reversed(sub_dirs))
+    return roots
+
+
 def find_topic_directories(search_directories):
     """
-    Search for all subdirectories in <g.script_directory> containing 'CMakeLists.txt'.
+    Search for all subdirectories in <g.script_directory> containing 'msg' or 'srv'.
     Return a list of these directories.
-    The function will not search further into subdirectories once a 'CMakeLists.txt' file is found.
+    The function will not search further into subdirectories once such a directory is found.
     :param search_directories: A list of directories to search (e.g., ['src', 'messages']).
     """
 
     topic_directories = []
 
-    # Walk through the specified directories
     for search_dir in search_directories:
         search_path = os.path.join(g.script_directory, search_dir)
-
-        for root, dirs, files in os.walk(search_path):
-            if "msg" in dirs or "srv" in dirs:
-                # Add the directory containing CMakeLists.txt to the list
-                topic_directories.append(root)
-                # Do not recurse into subdirectories (clear the dirs list)
-                dirs.clear()
+        topic_directories.extend(
+            _find_package_roots(
+                search_path,
+                lambda dir_names, _: "msg" in dir_names or "srv" in dir_names,
+            )
+        )
 
     return topic_directories
 
@@ -420,47 +599,51 @@ def find_project_directories(search_directories, install_dir, packages_to_ignore
 
     if packages_to_ignore is None:
         packages_to_ignore = []
+    packages_to_ignore = set(packages_to_ignore)
     project_directories = []
 
-    # Walk through the specified directories
     for search_dir in search_directories:
         search_path = os.path.join(g.script_directory, search_dir)
-
-        for root, dirs, files in os.walk(search_path):
-            project_name = os.path.basename(root)
-            if project_name in packages_to_ignore:
-                dirs.clear()
-                continue
-            if "CMakeLists.txt" in files:
-                # Add the directory containing CMakeLists.txt to the list
-                project_directories.append(root)
-                # Do not recurse into subdirectories (clear the dirs list)
-                dirs.clear()
-
-    for project_directory in project_directories:
-        # Directories to copy
-        directories_to_copy = ["resource", "config", "scripts"]
-
-        for directory in directories_to_copy:
-            # Construct the target directory path
-            target_directory = os.path.join(
-                g.script_directory,
-                install_dir,
-                directory,
-                os.path.basename(project_directory),
+        project_directories.extend(
+            _find_package_roots(
+                search_path,
+                lambda _, file_names: "CMakeLists.txt" in file_names,
+                packages_to_ignore,
             )
+        )
 
-            # Ensure the target directory exists, create it if not
-            source_dir = os.path.join(project_directory, directory)
-
-            # Check if the source directory exists
-            if os.path.exists(source_dir):
-                # Define the target path for this directory
-                os.makedirs(target_directory, exist_ok=True)
+    # Directories to copy
+    directories_to_copy = ["resource", "config", "scripts"]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        copies = []
+        for project_directory in project_directories:
+            for directory in directories_to_copy:
+                source_dir = os.path.join(project_directory, directory)
+
+                # Check if the source directory exists
+                if not os.path.exists(source_dir):
+                    continue
+
+                # Construct the target directory path
+                target_directory = os.path.join(
+                    g.script_directory,
+                    install_dir,
+                    directory,
+                    os.path.basename(project_directory),
+                )
+                _ensure_dir(target_directory)
                 target_path = os.path.join(target_directory, directory)
 
                 # Copy the entire directory
-                shutil.copytree(source_dir, target_path, dirs_exist_ok=True)
+                copies.append(
+                    executor.submit(
+                        shutil.copytree, source_dir, target_path, dirs_exist_ok=True
+                    )
+                )
+
+        for copy in copies:
+            copy.result()
 
     return project_directories
 
@@ -483,15 +666,17 @@ def find_interface_files(search_directories, interface_types, packages_to_ignore
         packages_to_ignore = []
 
     # This dictionary maps an interface type (e.g., 'action') to its file extension
-    # and the list where its found files will be stored.
-    interface_map = {interface: (f".{interface}", []) for interface in interface_types}
+    extensions = {interface: f".{interface}" for interface in interface_types}
+    generated_dest_dir = Path(g.script_directory) / "generated" / "include"
 
-    for search_dir in search_directories:
+    def walk(search_dir):
+        """Collect the interface files and include dirs under one search directory."""
+        found = {interface: [] for interface in interface_types}
+        include_dirs = []
         search_path = Path(g.script_directory) / search_dir
-        generated_dest_dir = Path(g.script_directory) / "generated" / "include"
 
         if not os.path.isdir(search_path):
-            continue
+            return found, include_dirs
 
         for root, dirs, files in os.walk(search_path):
             # Prune the search if the package directory should be ignored
@@ -499,18 +684,16 @@ def find_interface_files(search_directories, interface_types, packages_to_ignore
                 dirs.clear()
                 continue
 
-            if (Path(root) / "include").is_dir():
-                if (Path(root) / "msg").is_dir() or (Path(root) / "srv").is_dir():
-                    shutil.copytree(
-                        Path(root) / "include", generated_dest_dir, dirs_exist_ok=True
-                    )
+            if "include" in dirs and ("msg" in dirs or "srv" in dirs):
+                include_dirs.append(os.path.join(root, "include"))
 
             # The name of the directory we are currently in (e.g., 'msg', 'srv')
             current_dir_name = os.path.basename(root)
 
             # Check if this directory's name matches an interface type we're looking for
-            if current_dir_name in interface_map:
-                extension, target_list = interface_map[current_dir_name]
+            if current_dir_name in extensions:
+                extension = extensions[current_dir_name]
+                target_list = found[current_dir_name]
 
                 for filename in files:
                     if filename.endswith(extension):
@@ -521,9 +704,24 @@ def find_interface_files(search_directories, interface_types, packages_to_ignore
                 # so we don't need to search its subdirectories.
                 dirs.clear()
 
-    # Extract the populated lists from the map in the correct order
-    # and return them as a tuple.
-    return tuple(interface_map[interface][1] for interface in interface_types)
+        return found, include_dirs
+
+    # Walk the search directories concurrently; the walks are bound by
+    # filesystem syscalls rather than the GIL.
+    with concurrent.futures.ThreadPoolExecutor() as walk_executor:
+        results = list(walk_executor.map(walk, search_directories))
+
+    # Copy public headers one package at a time, in search and walk order, so
+    # when two packages ship the same header the last one wins as it always has
+    for _, include_dirs in results:
+        for include_dir in include_dirs:
+            shutil.copytree(include_dir, generated_dest_dir, dirs_exist_ok=True)
+
+    # Merge the per-directory lists in search order and return them as a tuple.
+    return tuple(
+        [path for found, _ in results for path in found[interface]]
+        for interface in interface_types
+    )
 
 
 def build_dependency_graph(project_directories):
@@ -542,23 +740,26 @@ def build_dependency_graph(project_directories):
     - graph: A dictionary where each project has a set of dependencies.
     - in_degree: A dictionary tracking how many dependencies each project has.
     """
-    graph = defaultdict(list)
+    graph = defaultdict(set)
 
-    # Iterate through each project directory
-    for project_dir in project_directories:
-        # Path to the CMakeLists.txt file for this project
-        cmake_file_path = os.path.join(project_dir, "CMakeLists.txt")
+    # Path to the CMakeLists.txt file of each project
+    cmake_file_paths = [
+        os.path.join(project_dir, "CMakeLists.txt")
+        for project_dir in project_directories
+    ]
 
+    # Read and scan the CMakeLists.txt files concurrently; this is mostly file I/O
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        all_dependencies = list(executor.map(find_dependencies, cmake_file_paths))
+
+    for project_dir, dependencies in zip(project_directories, all_dependencies):
         # Find the project name (assumes the project name is the directory name or can be derived)
         project_name = os.path.basename(project_dir)
+        graph[project_name] = set(dependencies)
 
-        # Get the dependencies of this project
-        dependencies = find_dependencies(cmake_file_path)
-        graph[project_name] = dependencies
-
-    for key in list(graph.keys()):
-        # Keep only elements in the list that are keys of the defaultdict
-        graph[key] = [elem for elem in graph[key] if elem in graph]
+    for deps in graph.values():
+        # Keep only dependencies that are themselves projects in the graph
+        deps.intersection_update(graph)
 
     return graph
 
@@ -566,31 +767,28 @@ def build_dependency_graph(project_directories):
 def find_dependencies(cmake_file_path):
     dependencies = []
     try:
-        with open(cmake_file_path, "r") as cmake_file:
-            # Read the entire file as a single string to handle multi-line target_link_libraries
-            cmake_content = cmake_file.read()
-
-        # Define the regex pattern to match "raisin_find_package(SOMETHING)"
-        pattern = r"raisin_find_package\((.*?)\)"
-
-        # List of keywords to ignore (in capital letters)
-        ignored_keywords = {
-            "REQUIRED",
-            "VERSION",
-            "CONFIG",
-            "COMPONENTS",
-            "QUIET",
-            "EXACT",
-        }
-
-        # Use re.findall() to find all matches for the pattern
-        matches = re.findall(pattern, cmake_content)
+        with open(cmake_file_path, "rb") as cmake_file:
+            if os.fstat(cmake_file.fileno()).st_size >= _MMAP_MIN_SIZE:
+                # Let the regex scan the page cache directly, decoding only the matches
+                with mmap.mmap(
+                    cmake_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as cmake_content:
+                    matches = [
+                        match.decode()
+                        for match in _RAISIN_FIND_PACKAGE_BYTES_RE.findall(
+                            cmake_content
+                        )
+                    ]
+            else:
+                # Find all "raisin_find_package(SOMETHING)" calls
+                cmake_content = cmake_file.read().decode()
+                matches = _RAISIN_FIND_PACKAGE_RE.findall(cmake_content)
 
         # Filter out matches that are keywords in capital letters
         for match in matches:
-            if match not in ignored_keywords:
+            if match not in _FIND_PACKAGE_KEYWORDS:
                 modified_match = match
-                for cmake_keyword in ignored_keywords:
+                for cmake_keyword in _FIND_PACKAGE_KEYWORDS:
                     modified_match = modified_match.replace(cmake_keyword, "").strip()
 
                 dependencies.append(modified_match)
@@ -605,54 +803,85 @@ def find_dependencies(cmake_file_path):
     return dependencies
 
 
-def move_key_before(dep, keys, key):
-    """
-    Move `key` right before `before_key` in the list of keys,
-    but only if it's not already before `before_key`.
-    """
-
-    # Find the index of before_key
-    dep_index = keys.index(dep)
-    key_index = keys.index(key)
-
-    # Check if the key is already before the before_key
-    if key_index > dep_index:
-        return keys  # Return the original list without changes
-
-    # Remove the key from its current position
-    keys.remove(key)
-
-    # Insert the key right before the given before_key
-    keys.insert(dep_index, key)
-
-    return keys
-
-
 def topological_sort(graph, keys):
     """
-    Perform a topological sort on the dependency graph.
-    Returns a list of keys sorted in dependency order.
+    Perform a topological sort on the dependency graph (Kahn's algorithm).
+    Returns a list of keys sorted in dependency order. Among projects whose
+    dependencies are already placed, the one listed first in `keys` comes first.
     """
+    position = {key: i for i, key in enumerate(keys)}
+    in_degree = dict.fromkeys(keys, 0)
+    dependents = defaultdict(list)
+    for key in keys:
+        for dep in set(graph[key]):  # For each key's dependencies in its value
+            if dep in position and dep != key:
+                in_degree[key] += 1
+                dependents[dep].append(key)
+
+    ready = [position[key] for key in keys if in_degree[key] == 0]
+    heapq.heapify(ready)
+    sorted_keys = []
+    while ready:
+        key = keys[heapq.heappop(ready)]
+        sorted_keys.append(key)
+        for dependent in dependents[key]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                heapq.heappush(ready, position[dependent])
+
+    if len(sorted_keys) < len(keys):
+        # Everything left over is on a cycle or depends on one. Find the
+        # strongly connected components of the leftovers (Tarjan's algorithm,
+        # iterative) and report only those with more than one project, so a
+        # project that merely sits between two cycles is not reported.
+        remaining = {key for key in keys if in_degree[key] > 0}
+        edges = {
+            key: [dep for dep in set(graph[key]) if dep in remaining and dep != key]
+            for key in remaining
+        }
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        on_cycle = set()
+        for root in keys:
+            if root not in remaining or root in index:
+                continue
+            work = [(root, iter(edges[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                key, it = work[-1]
+                for dep in it:
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(edges[dep])))
+                        break
+                    if dep in on_stack:
+                        lowlink[key] = min(lowlink[key], index[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[key])
+                    if lowlink[key] == index[key]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == key:
+                                break
+                        if len(component) > 1:
+                            on_cycle.update(component)
+        cyclic = [key for key in keys if key in on_cycle]
+        print(f"Cyclic dependency detected: {', '.join(cyclic)}")
+        sys.exit(1)
 
-    # Iterate over the keys and check if they appear in the values
-    original_keys = keys.copy()
-
-    for i in range(20):
-        previous_keys = keys.copy()
-        for key in original_keys:
-            for dep in graph[key]:  # For each key's dependencies in its value
-                if dep in graph:
-                    # Move the dependent `dep` before the key in the list, if not already before
-                    keys = move_key_before(dep, keys, key)
-
-        if previous_keys == keys:
-            return keys
-
-        if i == 19:
-            print(f"Cyclic dependency detected")
-            sys.exit(1)
-
-    return keys
+    return sorted_keys
 
 
 def update_cmake_file(project_directories, cmake_dir):
@@ -661,83 +890,96 @@ def update_cmake_file(project_directories, cmake_dir):
     the global 'g.build_pattern' (if not empty) or all projects, including their
     full dependency trees.
     """
-    # 1. Always build the full dependency graph first to know all relationships
-    full_graph = build_dependency_graph(project_directories)
-    all_project_names = list(full_graph.keys())
-
-    projects_to_include = set()
+    # Create a quick lookup from project name to its full directory path
+    project_dir_map = {os.path.basename(d): d for d in project_directories}
+    all_project_names = list(project_dir_map)
 
-    # 2. If g.build_pattern is set, filter projects. Otherwise, include all.
+    # 1./2. If g.build_pattern is set, filter projects. Otherwise, include all.
     if not g.build_pattern:
-        # If g.build_pattern is empty, include all discovered projects
+        # Every project is built, so read the full dependency graph at once
+        graph = build_dependency_graph(project_directories)
         projects_to_include = set(all_project_names)
     else:
-        # Find initial projects matching the build patterns
+        # Find initial projects matching the build patterns (one combined regex)
+        build_pattern_re = re.compile(
+            "|".join(f"(?:{fnmatch.translate(p)})" for p in g.build_pattern)
+        )
         initial_matches = {
-            name
-            for name in all_project_names
-            for pattern in g.build_pattern
-            if fnmatch.fnmatch(name, pattern)
+            name for name in all_project_names if build_pattern_re.match(name)
         }
 
-        # Find all dependencies for the matched projects recursively
-        queue = list(initial_matches)
-        visited = set()
+        # Find all dependencies for the matched projects recursively, reading
+        # only the CMakeLists.txt of projects that are actually reached
+        graph = {}
+        queue = deque(initial_matches)
         while queue:
-            project_name = queue.pop(0)
-            if project_name in visited:
+            project_name = queue.popleft()
+            if project_name in graph:
                 continue
 
-            visited.add(project_name)
-            projects_to_include.add(project_name)
+            cmake_file_path = os.path.join(
+                project_dir_map[project_name], "CMakeLists.txt"
+            )
+            dependencies = {
+                dep
+                for dep in find_dependencies(cmake_file_path)
+                if dep in project_dir_map
+            }
+            graph[project_name] = dependencies
 
             # Add its dependencies to the queue to be processed
-            dependencies = full_graph.get(project_name, [])
             queue.extend(dependencies)
 
-    # 3. Create a new graph containing only the projects to be included
+        projects_to_include = set(graph)
+
+    # 3. Create a new graph containing only the projects to be included,
+    # in discovery order
     filtered_graph = {
-        project: [dep for dep in deps if dep in projects_to_include]
-        for project, deps in full_graph.items()
+        project: graph[project] & projects_to_include
+        for project in all_project_names
         if project in projects_to_include
     }
 
     # 4. Perform a topological sort on the filtered set of projects
-    sorted_project_names = list(filtered_graph.keys())
-    for _ in range(2):  # Assuming this double-sort is for stabilization
-        sorted_project_names = topological_sort(filtered_graph, sorted_project_names)
+    sorted_project_names = topological_sort(filtered_graph, list(filtered_graph))
 
     # 5. Generate the CMakeLists.txt content from the sorted, filtered list
-    template_path = os.path.join(g.script_directory, "templates", "CMakeLists.txt")
-    with open(template_path, "r") as template_file:
-        cmake_template_content = template_file.read()
-
-    # Create a quick lookup from project name to its full directory path
-    project_dir_map = {os.path.basename(d): d for d in project_directories}
-
-    subdirectory_lines = []
-    for project_name in sorted_project_names:
-        if project_name in project_dir_map:
-            project_dir = project_dir_map[project_name]
-            if (Path(project_dir) / "CMakeLists.txt").is_file():
-                project_dir = project_dir.replace("\\", "/")
-                subdirectory_lines.append(f"add_subdirectory({project_dir})")
-
-    cmake_content = cmake_template_content.replace(
-        "@@SUB_PROJECT@@", "\n".join(subdirectory_lines)
+    cmake_template_content = _template("CMakeLists.txt")
+
+    # find_project_directories only returns directories with a CMakeLists.txt
+    subdirectory_lines = [
+        "add_subdirectory({})".format(project_dir_map[name].replace("\\", "/"))
+        for name in sorted_project_names
+    ]
+
+    cmake_content = _render_template(
+        cmake_template_content,
+        {
+            "SUB_PROJECT": "\n".join(subdirectory_lines),
+            "SCRIPT_DIR": g.script_directory,
+        },
     )
-    cmake_content = cmake_content.replace("@@SCRIPT_DIR@@", g.script_directory)
 
     cmake_file_path = os.path.join(g.script_directory, "CMakeLists.txt")
 
-    with open(cmake_file_path, "w") as cmake_file:
-        cmake_file.write(cmake_content)
+    # Leave an up-to-date CMakeLists.txt untouched so its mtime does not
+    # force CMake to re-configure on a no-op setup
+    try:
+        with open(cmake_file_path, "r") as cmake_file:
+            is_up_to_date = cmake_file.read() == cmake_content
+    except FileNotFoundError:
+        is_up_to_date = False
+
+    if not is_up_to_date:
+        with open(cmake_file_path, "w") as cmake_file:
+            cmake_file.write(cmake_content)
 
     print(
         f"📂 Generated CMakeLists.txt at {cmake_file_path} with {len(subdirectory_lines)} projects."
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def transform_data_type(data_type, project_name):
     """
     Transform the data type based on whether it ends in [] or [N].
@@ -756,7 +998,7 @@ def transform_data_type(data_type, project_name):
     stripped_data_type = stripped_data_type.split(">", 1)[0]
 
     # Check for array types (with [] or [N])
-    if match := re.match(r"([a-zA-Z0-9_]+)\[(\d+)\]", data_type):
+    if match := _FIXED_ARRAY_RE.match(data_type):
         # Fixed-size array ([N])
         base_type, size = match.groups()
         if base_type in TYPE_MAPPING:
@@ -814,49 +1056,46 @@ def transform_data_type(data_type, project_name):
         return f"{project_name}::msg::{data_type}", data_type, subproject_path, False
 
 
-def create_action_file(action_file, project_directory, install_dir):
+def create_action_file(action_file, project_directory, install_dir, skip_mkdir=False):
     """
     Create a message file based on the template, replacing '@@MESSAGE_NAME@@' with the message file name.
     The file is saved in <g.script_directory>/include/<project_directory>/msg.
+    Pass skip_mkdir=True when the output directories were already created with
+    _make_interface_dirs().
     """
-    template_path = os.path.join(g.script_directory, "templates", "ActionTemplate.hpp")
-
     # Extract the project name from the project directory path
     project_name = os.path.basename(project_directory)
 
-    # Determine the target directory in include/<project_name>/msg
+    # Determine the target directory in include/<project_name>/action
     include_project_msg_dir = os.path.join(
         g.script_directory, "generated", "include", project_name, "action"
     )
     destination_file = os.path.join(install_dir, "messages", project_name, "action", "")
-    os.makedirs(destination_file, exist_ok=True)
+    if not skip_mkdir:
+        _ensure_dir(destination_file)
+        _ensure_dir(include_project_msg_dir)
     shutil.copy2(action_file, destination_file)
 
-    # Delete the entire include directory before generating new files
-    os.makedirs(include_project_msg_dir, exist_ok=True)  # Recreate it
-
-    # Read the template
-    with open(template_path, "r") as template_file:
-        template_content = template_file.read()
+    # Read the template (cached across calls)
+    template_content = _template("ActionTemplate.hpp")
 
     # Replace the placeholder with the message file name
     message_name = str(os.path.basename(action_file).replace(".action", ""))
     class_name = message_name.replace("_", "")
-    message_content = template_content.replace(
-        "@@LOWER_MESSAGE_NAME@@", class_name.lower()
+    message_content = _render_template(
+        template_content,
+        {
+            "LOWER_MESSAGE_NAME": class_name.lower(),
+            "MESSAGE_NAME": class_name,
+            "PROJECT_NAME": project_name,
+        },
     )
-    message_content = message_content.replace("@@MESSAGE_NAME@@", class_name)
-    message_content = message_content.replace("@@PROJECT_NAME@@", project_name)
 
     # Create the message file in the <g.script_directory>/include/<project_directory>/msg directory
-    snake_str = re.sub(
-        r"(?<!^)(?=[A-Z][a-z]|(?<=[a-z])[A-Z]|(?<=[0-9])(?=[A-Z]))", "_", message_name
-    ).lower()
-    snake_str = snake_str.replace("__", "_")
+    snake_str = _to_snake(message_name)
     output_path = os.path.join(include_project_msg_dir, f"{snake_str}.hpp")
 
-    with open(output_path, "w") as output_file:
-        output_file.write(message_content)
+    _write_generated(output_path, message_content)
 
     ### create other interface files
     action_path = Path(action_file)
@@ -872,18 +1111,22 @@ def create_action_file(action_file, project_directory, install_dir):
 
     msg_dir = Path(g.script_directory) / "temp" / project_name / "msg"
     srv_dir = Path(g.script_directory) / "temp" / project_name / "srv"
-    msg_dir.mkdir(parents=True, exist_ok=True)
-    srv_dir.mkdir(parents=True, exist_ok=True)
+    if not skip_mkdir:
+        _ensure_dir(str(msg_dir))
+        _ensure_dir(str(srv_dir))
 
     # --- 3. Split the action file content ---
-    parts = action_file_content.split("---")
-    if len(parts) != 3:
+    parts = action_file_content.split("---", 2)
+    if len(parts) != 3 or "---" in parts[2]:
         print(
             f"❌ ERROR: Invalid action file format of {action_file}. Must contain two '---' separators."
         )
         return
 
-    goal_content, result_content, feedback_content = [part.strip() for part in parts]
+    goal_raw, result_raw, feedback_raw = parts
+    goal_content = goal_raw.strip()
+    result_content = result_raw.strip()
+    feedback_content = feedback_raw.strip()
 
     # --- 4. Write each message file ---
     message_definitions = {
@@ -922,13 +1165,13 @@ def create_action_file(action_file, project_directory, install_dir):
     file_path.write_text(feedback_message_content)
 
 
-def create_message_file(msg_file, project_directory, install_dir):
+def create_message_file(msg_file, project_directory, install_dir, skip_mkdir=False):
     """
     Create a message file based on the template, replacing '@@MESSAGE_NAME@@' with the message file name.
     The file is saved in <g.script_directory>/include/<project_directory>/msg.
+    Pass skip_mkdir=True when the output directories were already created with
+    _make_interface_dirs().
     """
-    template_path = os.path.join(g.script_directory, "templates", "MessageTemplate.hpp")
-
     # Extract the project name from the project directory path
     project_name = os.path.basename(project_directory)
 
@@ -937,181 +1180,165 @@ def create_message_file(msg_file, project_directory, install_dir):
         g.script_directory, "generated", "include", project_name, "msg"
     )
     destination_file = os.path.join(install_dir, "messages", project_name, "msg", "")
-    os.makedirs(destination_file, exist_ok=True)
+    if not skip_mkdir:
+        _ensure_dir(destination_file)
+        _ensure_dir(include_project_msg_dir)
     shutil.copy2(msg_file, destination_file)
 
-    # Delete the entire include directory before generating new files
-    os.makedirs(include_project_msg_dir, exist_ok=True)  # Recreate it
+    # Read the template (cached across calls)
+    template_content = _template("MessageTemplate.hpp")
 
-    # Read the template
-    with open(template_path, "r") as template_file:
-        template_content = template_file.read()
-
-    # Replace the placeholder with the message file name
+    # Derive the class name from the message file name
     message_name = os.path.basename(msg_file).replace(".msg", "")
     class_name = message_name.replace("_", "")
-    message_content = template_content.replace("@@MESSAGE_NAME@@", class_name)
-    message_content = message_content.replace("@@PROJECT_NAME@@", project_name)
 
-    # Read the message file and process its contents
-    with open(msg_file, "r") as msg_file_content:
-        lines = msg_file_content.readlines()
-
-    includes = []
+    includes = {}  # ordered set: a type used by several fields is included once
     members = []
     buffer_members = []
     buffer_size = []
 
-    for line in lines:
-        line = line.strip()
+    # Read the message file and process its contents line by line
+    with open(msg_file) as msg_lines:
+        for line in msg_lines:
+            # Strip surrounding whitespace and trailing comments; skip empty lines
+            m = _FIELD_RE.match(line)
+            if not m:
+                continue
+            line = m.group(1)
 
-        # Ignore comments by splitting at '#' and taking the part before it
-        line = line.split("#", 1)[0].strip()
+            parts = line.split()
 
-        # Skip empty lines
-        if not line:
-            continue
-
-        parts = line.split()
-        parts_in_two = line.split(" ", 1)
+            # Constants carry their '=' after the type, e.g. 'int32 MAX=5'
+            if len(parts) < 4 and "=" not in line.partition(" ")[2]:
+                initial_value = ""
+                if len(parts) == 3:
+                    data_type, data_name, initial_value = parts
+                else:
+                    data_type, data_name = parts
 
-        if len(parts) < 4 and "=" not in parts_in_two[1]:
-            initial_value = ""
-            if len(parts) == 3:
-                data_type, data_name, initial_value = parts
-            else:
-                data_type, data_name = parts
+                # Transform the data type for arrays
+                transformed_type, base_type, subproject_path, found_type = (
+                    transform_data_type(data_type, project_name)
+                )
+                data_name = _to_snake(data_name)
 
-            # Transform the data type for arrays
-            transformed_type, base_type, subproject_path, found_type = (
-                transform_data_type(data_type, project_name)
-            )
-            data_name = re.sub(
-                r"(?<!^)(?=[A-Z][a-z]|(?<=[a-z])[A-Z]|(?<=[0-9])(?=[A-Z]))",
-                "_",
-                data_name,
-            ).lower()
-            data_name = data_name.replace("__", "_")
+                # Check if the type is a known message type (not a primitive)
+                if not found_type:
+                    # Use the preferred include format with relative path
+                    if not subproject_path:
+                        subproject_path = project_name
 
-            # Check if the type is a known message type (not a primitive)
-            if not found_type:
-                # Use the preferred include format with relative path
-                if not subproject_path:
-                    subproject_path = project_name
+                    if data_type != "Header":
+                        includes[_msg_include(subproject_path, base_type)] = None
+                    else:
+                        includes['#include "../../std_msgs/msg/header.hpp"'] = None
 
-                if data_type != "Header":
-                    snake_str = re.sub(
-                        r"(?<!^)(?=[A-Z][a-z]|(?<=[a-z])[A-Z]|(?<=[0-9])(?=[A-Z]))",
-                        "_",
-                        base_type,
-                    ).lower()
-                    snake_str = snake_str.replace("__", "_")
-                    includes.append(
-                        f'#include "../../{subproject_path}/msg/{snake_str}.hpp"'
-                    )
+                members.append(f"using _{data_name}_type = {transformed_type};")
+                if len(parts) == 3:
+                    members.append(f"{transformed_type} {data_name} = {initial_value};")
                 else:
-                    includes.append(f'#include "../../std_msgs/msg/header.hpp"')
+                    members.append(f"{transformed_type} {data_name};")
+                buffer_members.append(data_name)
 
-            members.append(f"using _{data_name}_type = {transformed_type};")
-            if len(parts) == 3:
-                members.append(f"{transformed_type} {data_name} = {initial_value};")
-            else:
-                members.append(f"{transformed_type} {data_name};")
-            buffer_members.append(data_name)
-
-            if transformed_type.startswith(
-                "std::vector"
-            ) or transformed_type.startswith("std::array"):
-                if base_type in STRING_TYPES:
-                    buffer_size.append(
-                        f"temp += sizeof(uint32_t); \n for (const auto& v : {data_name}) temp += sizeof(uint32_t) + v.size();"
-                    )
-                elif base_type in TYPE_MAPPING.values():
-                    buffer_size.append(
-                        f"temp += {data_name}.size() * sizeof({data_name});"
-                    )
-                else:
-                    buffer_size.append(
-                        f"for (const auto& v : {data_name}) temp += v.getSize();"
-                    )
-            else:
-                if transformed_type in STRING_TYPES:
-                    buffer_size.append(
-                        f"temp += sizeof(uint32_t) + {data_name}.size();"
-                    )
-                elif (
-                    transformed_type in TYPE_MAPPING.values()
-                    and transformed_type != "std::string"
-                    and transformed_type != "std::u16string"
-                ):
-                    buffer_size.append(f"temp += sizeof({data_name});")
-                else:
-                    buffer_size.append(f"temp += {data_name}.getSize();")
+                buffer_size.append(
+                    _buffer_size_expression(transformed_type, base_type, data_name)
+                )
 
-        elif "=" in line:
-            parts = line.split(" ", 1)
-            members.append(f"static constexpr {TYPE_MAPPING[parts[0]]} {parts[1]};")
+            elif "=" in line:
+                parts = line.split(" ", 1)
+                members.append(f"static constexpr {TYPE_MAPPING[parts[0]]} {parts[1]};")
 
-    # Insert includes and members into the template
-    message_content = message_content.replace("@@INCLUDE_PATH@@", "\n".join(includes))
-    message_content = message_content.replace("@@MEMBERS@@", "\n  ".join(members))
-    message_content = message_content.replace(
-        "@@BUFFER_SIZE_EXPRESSION@@", "\n  ".join(buffer_size)
+    (
+        set_buffer_member_string,
+        modified_set_buffer_member_string,
+        get_buffer_member_string,
+        equal_buffer_member_string,
+    ) = _buffer_member_strings(buffer_members)
+
+    # Fill in all placeholders of the template in a single pass
+    message_content = _render_template(
+        template_content,
+        {
+            "MESSAGE_NAME": class_name,
+            "PROJECT_NAME": project_name,
+            "INCLUDE_PATH": "\n".join(includes),
+            "MEMBERS": "\n  ".join(members),
+            "BUFFER_SIZE_EXPRESSION": "\n  ".join(buffer_size),
+            "SET_BUFFER_MEMBERS": set_buffer_member_string,
+            "SET_BUFFER_MEMBERS2": modified_set_buffer_member_string,
+            "GET_BUFFER_MEMBERS": get_buffer_member_string,
+            "EQUAL_BUFFER_MEMBERS": equal_buffer_member_string,
+        },
     )
 
-    set_buffer_member_string = ""
-    get_buffer_member_string = ""
-    equal_buffer_member_string = ""
-
-    for bm in buffer_members:
-        set_buffer_member_string += f"::raisin::setBuffer(buffer, {bm});\n"
+    # Create the message file in the <g.script_directory>/include/<project_directory>/msg directory
+    snake_str = _to_snake(message_name)
+    output_path = os.path.join(include_project_msg_dir, f"{snake_str}.hpp")
 
-    for bm in buffer_members:
-        get_buffer_member_string += f"temp = ::raisin::getBuffer(temp, {bm});\n"
+    _write_generated(output_path, message_content)
 
-    for bm in buffer_members:
-        equal_buffer_member_string += f"&& this->{bm} == other.{bm} \n"
+    # print(f"Created message file: {output_path}")
 
-    message_content = message_content.replace(
-        "@@SET_BUFFER_MEMBERS@@", set_buffer_member_string
-    )
-    modified_set_buffer_member_string = "\n".join(
-        "buffer = " + line for line in set_buffer_member_string.splitlines()
-    )
-    message_content = message_content.replace(
-        "@@SET_BUFFER_MEMBERS2@@", modified_set_buffer_member_string
-    )
-    message_content = message_content.replace(
-        "@@GET_BUFFER_MEMBERS@@", get_buffer_member_string
-    )
-    message_content = message_content.replace(
-        "@@EQUAL_BUFFER_MEMBERS@@", equal_buffer_member_string
-    )
 
-    # Create the message file in the <g.script_directory>/include/<project_directory>/msg directory
-    snake_str = re.sub(
-        r"(?<!^)(?=[A-Z][a-z]|(?<=[a-z])[A-Z]|(?<=[0-9])(?=[A-Z]))", "_", message_name
-    ).lower()
-    snake_str = snake_str.replace("__", "_")
-    output_path = os.path.join(include_project_msg_dir, f"{snake_str}.hpp")
+def _make_interface_dirs(interface_files, interface_type, install_dir):
+    """
+    Create the output directories needed by create_message_file /
+    create_action_file for all interface_files, once per directory.
 
-    with open(output_path, "w") as output_file:
-        output_file.write(message_content)
+    :param interface_files: Paths to .msg or .action files (<project>/<type>/<file>)
+    :param interface_type: 'msg' or 'action'
+    :param install_dir: Installation directory
+    """
+    directories = set()
+    for interface_file in interface_files:
+        project_name = Path(interface_file).parent.parent.name
+        directories.add(
+            os.path.join(
+                g.script_directory, "generated", "include", project_name, interface_type
+            )
+        )
+        directories.add(
+            os.path.join(install_dir, "messages", project_name, interface_type, "")
+        )
+        if interface_type == "action":
+            # create_action_file also splits actions into temp/<project>/{msg,srv}
+            for sub_dir in ("msg", "srv"):
+                directories.add(
+                    os.path.join(g.script_directory, "temp", project_name, sub_dir)
+                )
 
-    # print(f"Created message file: {output_path}")
+    for directory in directories:
+        _ensure_dir(directory)
 
 
 def get_ubuntu_version():
-    with open("/etc/os-release") as f:
-        for line in f:
-            if "VERSION=" in line:
-                version = line.split("=")[1].strip().strip('"')
-                match = re.search(r"(\d+\.\d+)", version)
-                if match:
-                    return match.group(1)
+    # /etc/os-release is parsed once and shared with the OS detection at startup
+    match = _VERSION_RE.search(read_os_release().get("VERSION", ""))
+    if match:
+        return match.group(1)
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _read_raisin_ignore():
+    """
+    Return the lines of the RAISIN_IGNORE file next to this module, read once
+    per process. Returns an empty tuple when the file doesn't exist.
+    """
+    try:
+        # Construct the full path to 'RAISIN_IGNORE' next to the current script
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        file_path = os.path.join(script_dir, "RAISIN_IGNORE")
+
+        with open(file_path, "r") as file:
+            return tuple(line.strip() for line in file)
+
+    except FileNotFoundError:
+        return ()  # File doesn't exist, that's okay
+    except Exception as e:
+        raise Exception(f"An error occurred while reading RAISIN_IGNORE file: {e}")
+
+
 def get_packages_to_ignore():
     """
     Gets packages to ignore from multiple sources:
@@ -1129,37 +1356,52 @@ def get_packages_to_ignore():
         pass  # If configuration loading fails, continue with file-based approach
 
     # Get packages from RAISIN_IGNORE file (backward compatibility)
-    try:
-        # Get the absolute path of the current script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        # Construct the full path to 'RAISIN_IGNORE'
-        file_path = os.path.join(script_dir, "RAISIN_IGNORE")
-
-        # Read the file and add its lines to the list
-        with open(file_path, "r") as file:
-            file_lines = [line.strip() for line in file.readlines()]
-            ignore_packages.extend(file_lines)
-
-    except FileNotFoundError:
-        pass  # File doesn't exist, that's okay
-    except Exception as e:
-        raise Exception(f"An error occurred while reading RAISIN_IGNORE file: {e}")
+    ignore_packages.extend(_read_raisin_ignore())
 
     # Remove duplicates while preserving order
     return list(dict.fromkeys(ignore_packages))
 
 
+# Build output and tool directories that never contain package repositories
+_GIT_SEARCH_SKIP_DIRS = frozenset(
+    {
+        "build",
+        "install",
+        "generated",
+        ".vcpkg",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+    }
+)
+
+
 def find_git_repos(base_dir):
     """
     Recursively search for directories that contain a .git folder.
     Returns a list of paths that are Git repositories.
     """
     git_repos = []
-    for root, dirs, _ in os.walk(base_dir):
-        if ".git" in dirs:
-            git_repos.append(root)
-            # Prevent descending into this repository's subdirectories.
-            dirs.clear()
+    stack = [base_dir]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name == ".git" and entry.is_dir():
+                        git_repos.append(root)
+                        # Prevent descending into this repository's subdirectories.
+                        subdirs = []
+                        break
+                    if entry.name not in _GIT_SEARCH_SKIP_DIRS and entry.is_dir(
+                        follow_symlinks=False
+                    ):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        # Visit subdirectories in the order they were listed
+        stack.extend(reversed(subdirs))
     return git_repos
 
 
@@ -1170,10 +1412,9 @@ def install_development_tools():
     print("Checking and installing development tools...")
 
     # Check if clang-format is installed
-    try:
-        subprocess.run(["clang-format", "--version"], capture_output=True, check=True)
+    if shutil.which("clang-format"):
         print("✅ clang-format is already installed")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print("Installing clang-format...")
         try:
             # Install clang-format based on the system
@@ -1214,46 +1455,28 @@ def install_development_tools():
         except Exception as e:
             print(f"❌ Error installing clang-format: {str(e)}")
 
-        # Check if pre-commit is installed
+    # Check if pre-commit is installed
     pre_commit_installed = False
 
-    # Try system Python first (for git hooks)
-    try:
-        result = subprocess.run(
-            ["/usr/bin/python3", "-m", "pre_commit", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            print("✅ pre-commit is already installed (system Python)")
-            pre_commit_installed = True
-    except Exception:
-        pass
+    # Look it up on PATH and in the current Python without spawning a process
+    if shutil.which("pre-commit"):
+        print("✅ pre-commit is already installed")
+        pre_commit_installed = True
+    elif importlib.util.find_spec("pre_commit") is not None:
+        print("✅ pre-commit is already installed (python module)")
+        pre_commit_installed = True
 
-    # Try direct command if system Python doesn't work
-    if not pre_commit_installed:
+    # Fall back to probing the system Python (used by git hooks)
+    if not pre_commit_installed and sys.executable != "/usr/bin/python3":
         try:
             result = subprocess.run(
-                ["pre-commit", "--version"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                print("✅ pre-commit is already installed")
-                pre_commit_installed = True
-        except Exception:
-            pass
-
-    # Try current Python module if direct command failed
-    if not pre_commit_installed:
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pre_commit", "--version"],
+                ["/usr/bin/python3", "-m", "pre_commit", "--version"],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
             if result.returncode == 0 and result.stdout.strip():
-                print("✅ pre-commit is already installed (python module)")
+                print("✅ pre-commit is already installed (system Python)")
                 pre_commit_installed = True
         except Exception:
             pass
@@ -1288,11 +1511,49 @@ def install_development_tools():
                     )
 
 
+_OBJECT_ID_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+
+def _read_git_head(repo_path):
+    """
+    Resolve HEAD by reading the repository's .git directory, without starting git.
+    Returns None for anything it doesn't handle (a .git file, an unborn branch,
+    the reftable ref format), so the caller can ask git instead.
+    """
+    git_dir = os.path.join(repo_path, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+        if head.startswith("ref: "):
+            ref = head[5:]
+            try:
+                with open(os.path.join(git_dir, ref)) as f:
+                    head = f.read().strip()
+            except FileNotFoundError:
+                # The ref may only exist in packed-refs
+                head = None
+                with open(os.path.join(git_dir, "packed-refs")) as f:
+                    for line in f:
+                        object_id, _, name = line.rstrip("\n").partition(" ")
+                        if name == ref:
+                            head = object_id
+                            break
+    except OSError:
+        return None
+    if head and _OBJECT_ID_RE.fullmatch(head):
+        return head
+    return None
+
+
 def get_commit_hash(repo_path):
     """
     Returns the current commit hash (HEAD) for the repository at repo_path.
-    Uses the git command-line tool.
+    Reads it from the .git directory when possible, otherwise uses the git
+    command-line tool.
     """
+    commit_hash = _read_git_head(repo_path)
+    if commit_hash:
+        return commit_hash
     try:
         commit_hash = (
             subprocess.check_output(
@@ -1317,12 +1578,12 @@ def read_existing_data(file_path):
     data = {}
     if os.path.exists(file_path):
         with open(file_path, "r") as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    repo_name = parts[0]
-                    commit_hash = parts[1]
-                    data[repo_name] = commit_hash
+            content = f.read()
+        for line in content.splitlines():
+            # Only the first two whitespace-separated fields are needed
+            parts = line.split(None, 2)
+            if len(parts) >= 2:
+                data[parts[0]] = parts[1]
     return data
 
 
@@ -1330,18 +1591,32 @@ def write_data(file_path, data):
     """
     Writes the data (a dict of repo names to commit hashes) to the file.
     """
+    content = "".join(f"{repo} {commit}\n" for repo, commit in data.items())
     with open(file_path, "w") as f:
-        for repo, commit in data.items():
-            f.write(f"{repo} {commit}\n")
+        f.write(content)
 
 
 def copy_resource(install_dir):
     target_dir = "resource"
-    for root, dirs, files in os.walk(os.path.join(Path.home(), ".raisin")):
-
-        # Check if the directory contains the target g.architecture subdirectory
-        if target_dir in dirs:
+    stack = [os.path.join(Path.home(), ".raisin")]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        has_target = False
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name == target_dir:
+                        # Check if the directory contains the target subdirectory
+                        has_target = entry.is_dir()
+                        # The resource tree is copied as a whole; don't walk into it
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
 
+        if has_target:
             source_dir = os.path.join(root, target_dir)
             dest_dir = os.path.join(
                 g.script_directory,
@@ -1351,13 +1626,103 @@ def copy_resource(install_dir):
                 target_dir,
             )
 
-            for item in os.listdir(source_dir):
-                s = os.path.join(source_dir, item)
-                d = os.path.join(dest_dir, item)
-                if os.path.isdir(s):
-                    shutil.copytree(s, d, dirs_exist_ok=True)
+            shutil.copytree(source_dir, dest_dir, dirs_exist_ok=True)
+
+        # Visit subdirectories in the order they were listed, like os.walk
+        stack.extend(reversed(subdirs))
+
+
+def _link_or_copy(src, dst):
+    """
+    Hard-link src to dst, replacing an existing dst. Falls back to a copy when
+    linking is not possible (e.g. across filesystems).
+    """
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    # Replace the existing dst once; if that fails too, fall back to a copy
+    try:
+        os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _copy_replacing(src, dst):
+    """
+    shutil.copy2 that replaces an existing dst instead of writing into it, so a
+    file hard-linked elsewhere (by _link_tree or _link_if_changed) keeps its contents.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    return shutil.copy2(src, dst)
+
+
+# Released files that are only ever read (headers and libraries), and so are
+# safe to hard-link into install/ instead of copying
+_LINKABLE_SUFFIXES = frozenset(
+    {".h", ".hh", ".hpp", ".hxx", ".inl", ".ipp", ".so", ".a", ".dylib", ".lib", ".dll"}
+)
+
+
+def _is_linkable(path):
+    """
+    Return True if path is a header or a (possibly versioned) library.
+    """
+    name = os.path.basename(path)
+    if ".so." in name:  # libfoo.so.1.2
+        return True
+    return os.path.splitext(name)[1] in _LINKABLE_SUFFIXES
+
+
+def _link_if_changed(src, dst):
+    """
+    _link_or_copy for headers and libraries, _copy_replacing for everything else,
+    skipped when dst already has the size and mtime of src (as a link to src, or
+    to a file with the same metadata, does). An existing dst is replaced rather
+    than written into, so other links to it are untouched.
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        src_stat = os.stat(src)
+        if (
+            dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            return dst
+    if _is_linkable(src):
+        _link_or_copy(src, dst)
+    else:
+        _copy_replacing(src, dst)
+    return dst
+
+
+def _link_tree(src, dst):
+    """
+    Mirror src into dst like shutil.copytree(src, dst, dirs_exist_ok=True), but
+    hard-link the files instead of copying their contents.
+    """
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
                 else:
-                    shutil.copy2(s, d)
+                    _link_or_copy(entry.path, target)
 
 
 def copy_installers(src_dir, install_dir) -> int:
@@ -1384,9 +1749,10 @@ def copy_installers(src_dir, install_dir) -> int:
         return
         # raise FileNotFoundError(f"{src_root} does not exist")
 
-    for child in src_root.iterdir():
-        if not child.is_dir():
-            continue  # skip non-directories
+    with os.scandir(src_root) as it:
+        children = [Path(e.path) for e in it if e.is_dir()]  # skip non-directories
+
+    for child in children:
         src_installer = child / "install_dependencies.sh"
         if not src_installer.is_file():
             continue  # nothing to copy in this subdir
@@ -1410,6 +1776,17 @@ def deploy_install_packages():
     '{g.script_directory}/install/{target}/{g.os_type}/{g.architecture}', merging the
     contents from different build types (e.g., 'release', 'debug').
 
+    Headers and libraries are hard-linked rather than copied, so they share
+    their inode with the file under 'release/install': writing into one in
+    place (instead of replacing it) also changes the released copy. Other
+    files, such as configs a user may edit, are copied. Writers known to be
+    safe are setup() itself, which wipes 'install' first and then only writes
+    through _link_tree, _link_if_changed and _copy_replacing, and the install
+    command, which deletes a release directory before unpacking a new one.
+    A CMake install ('raisin build --install') may write into an existing file
+    in place; it does not touch released packages because a package in 'src'
+    is never deployed from 'release', unless two packages install the same path.
+
     Args:
         g.script_directory (str): The absolute path to the base directory.
     """
@@ -1441,22 +1818,35 @@ def deploy_install_packages():
     )
     deployed_targets = set()
 
+    # Destinations are the same for every source directory
+    src_root = os.path.join(g.script_directory, "src")
+    final_dest_dir = os.path.join(g.script_directory, "install")
+    generated_dest_dir = os.path.join(g.script_directory, "generated")
+    dependencies_dest_dir = os.path.join(final_dest_dir, "dependencies")
+
+    # Packages built from source take precedence over released ones
     try:
-        for source_dir in found_source_dirs:
-            if not os.path.isdir(source_dir):
-                continue
+        with os.scandir(src_root) as it:
+            src_packages = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        src_packages = set()
 
-            if os.path.isdir(
-                Path(g.script_directory) / "src" / Path(source_dir).parts[-5]
-            ):
+    try:
+        for source_dir in found_source_dirs:
+            # One directory listing answers every existence check below
+            try:
+                with os.scandir(source_dir) as it:
+                    entries = {entry.name: entry for entry in it}
+            except (NotADirectoryError, FileNotFoundError):
                 continue
 
             # Use pathlib to easily get the 'target' name from the path
             # The path is .../install/{target}/{os}/{g.os_version}/{arch}/{build_type}
             p = Path(source_dir)
             target_name = p.parents[3].name
-            final_dest_dir = os.path.join(g.script_directory, "install")
-            generated_dest_dir = os.path.join(g.script_directory, "generated")
+
+            if target_name in src_packages:
+                continue
 
             # Print the target-specific message only once
             if target_name not in deployed_targets:
@@ -1464,39 +1854,51 @@ def deploy_install_packages():
                 deployed_targets.add(target_name)
 
             release_yaml_path = p / "release.yaml"
-            if release_yaml_path.is_file():
+            release_yaml_entry = entries.get("release.yaml")
+            if release_yaml_entry is not None and release_yaml_entry.is_file():
                 try:
-                    with open(release_yaml_path, "r") as f:
-                        release_data = yaml.safe_load(f)
-                        # Ensure data was loaded and is a dictionary
-                        if release_data and isinstance(release_data, dict):
-                            # Safely get the list of dependencies, default to empty list
-                            dependencies = release_data.get("g.vcpkg_dependencies", [])
-                            if dependencies and isinstance(dependencies, list):
-                                # Use set.update() to add all items from the list
-                                g.vcpkg_dependencies.update(dependencies)
+                    release_data = load_yaml(release_yaml_path)
+                    # Ensure data was loaded and is a dictionary
+                    if release_data and isinstance(release_data, dict):
+                        # Safely get the list of dependencies, default to empty list
+                        dependencies = release_data.get("g.vcpkg_dependencies", [])
+                        if dependencies and isinstance(dependencies, list):
+                            # Use set.update() to add all items from the list
+                            g.vcpkg_dependencies.update(dependencies)
                 except yaml.YAMLError as ye:
                     print(f"    - ⚠️ Warning: Could not parse {release_yaml_path}: {ye}")
                 except IOError as ioe:
                     print(f"    - ⚠️ Warning: Could not read {release_yaml_path}: {ioe}")
 
-            # Copy contents, merging files from different build_types
-            shutil.copytree(source_dir, final_dest_dir, dirs_exist_ok=True)
+            # Hard-link the contents, merging files from different build_types.
+            # Files an earlier build type already put there are not linked again.
+            shutil.copytree(
+                source_dir,
+                final_dest_dir,
+                dirs_exist_ok=True,
+                copy_function=_link_if_changed,
+            )
 
-            if (p / "generated").is_dir():
-                shutil.copytree(p / "generated", generated_dest_dir, dirs_exist_ok=True)
+            generated_entry = entries.get("generated")
+            if generated_entry is not None and generated_entry.is_dir():
+                # generated/ is already hard-linked into install/, so replace files
+                # rather than writing through the shared links
+                shutil.copytree(
+                    p / "generated",
+                    generated_dest_dir,
+                    dirs_exist_ok=True,
+                    copy_function=_link_if_changed,
+                )
 
-            if (p / "install_dependencies.sh").is_file():
-                os.makedirs(
-                    Path(g.script_directory) / "install/dependencies" / target_name,
-                    exist_ok=True,
+            installer_entry = entries.get("install_dependencies.sh")
+            if installer_entry is not None and installer_entry.is_file():
+                target_dependencies_dir = os.path.join(
+                    dependencies_dest_dir, target_name
                 )
-                shutil.copy(
+                os.makedirs(target_dependencies_dir, exist_ok=True)
+                _copy_replacing(
                     p / "install_dependencies.sh",
-                    Path(g.script_directory)
-                    / "install/dependencies"
-                    / target_name
-                    / "install_dependencies.sh",
+                    os.path.join(target_dependencies_dir, "install_dependencies.sh"),
                 )
 
         if deployed_targets:
@@ -1524,31 +1926,29 @@ def collect_src_vcpkg_dependencies():
 
     print(f"🔍 Scanning for vcpkg dependencies in: {src_path}")
 
-    # Iterate over each item in the 'src' directory
-    for project_dir in src_path.iterdir():
-        # Process only if the item is a directory
-        if not project_dir.is_dir():
-            continue
+    # Iterate over each directory in 'src'
+    with os.scandir(src_path) as it:
+        project_dirs = [Path(e.path) for e in it if e.is_dir()]
 
+    for project_dir in project_dirs:
         release_yaml_path = project_dir / "release.yaml"
 
         # Check if 'release.yaml' exists in the subdirectory
         if release_yaml_path.is_file():
             try:
-                with open(release_yaml_path, "r") as f:
-                    release_data = yaml.safe_load(f)
+                release_data = load_yaml(release_yaml_path)
 
-                    # Ensure data was loaded and is a dictionary
-                    if release_data and isinstance(release_data, dict):
-                        # Safely get the list of dependencies, defaulting to an empty list
-                        dependencies = release_data.get("g.vcpkg_dependencies", [])
+                # Ensure data was loaded and is a dictionary
+                if release_data and isinstance(release_data, dict):
+                    # Safely get the list of dependencies, defaulting to an empty list
+                    dependencies = release_data.get("g.vcpkg_dependencies", [])
 
-                        if dependencies and isinstance(dependencies, list):
-                            print(
-                                f"  -> Found {len(dependencies)} dependencies in '{project_dir.name}'"
-                            )
-                            # Merge the found dependencies into the main set
-                            g.vcpkg_dependencies.update(dependencies)
+                    if dependencies and isinstance(dependencies, list):
+                        print(
+                            f"  -> Found {len(dependencies)} dependencies in '{project_dir.name}'"
+                        )
+                        # Merge the found dependencies into the main set
+                        g.vcpkg_dependencies.update(dependencies)
 
             except yaml.YAMLError as e:
                 print(f"  -> ⚠️ Error parsing YAML in '{project_dir.name}': {e}")
@@ -1581,11 +1981,10 @@ def generate_vcpkg_json():
     try:
         # --- 2. Read the template file ---
         print(f"Reading template from: {template_path}")
-        with open(template_path, "r", encoding="utf-8") as f:
-            template_content = f.read()
+        template_content = _template("vcpkg.json")
 
         # --- 3. Replace the placeholder ---
-        new_content = template_content.replace("@@DEP@@", deps_string)
+        new_content = _render_template(template_content, {"DEP": deps_string})
 
         # --- 4. Write to the output file ---
         # Using "w" mode will create the file or overwrite it if it already exists.
@@ -1601,6 +2000,18 @@ def generate_vcpkg_json():
         print(f"An unexpected error occurred: {e}")
 
 
+def _read_release_version(release_yaml) -> str:
+    """
+    Return the top-level 'version' of a release.yaml as a string ('' if absent).
+    A plain 'version: x.y.z' line is read without parsing the whole document.
+    """
+    m = _RELEASE_VERSION_RE.search(Path(release_yaml).read_bytes())
+    if m:
+        return m.group(1).decode().strip()
+    info = load_yaml(release_yaml) or {}
+    return str(info.get("version", "")).strip()
+
+
 def guard_require_version_bump_for_src_packages():
     """
     Enforce:
@@ -1617,20 +2028,21 @@ def guard_require_version_bump_for_src_packages():
         return  # nothing to check
 
     violations = []
+    candidates = []
 
-    for pkg_dir in sorted([p for p in src_dir.iterdir() if p.is_dir()]):
-        package_name = pkg_dir.name
+    with os.scandir(src_dir) as it:
+        pkg_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+    for entry in pkg_entries:
+        pkg_dir = Path(entry.path)
+        package_name = entry.name
         release_yaml = pkg_dir / "release.yaml"
         if not release_yaml.is_file():
             continue
 
         # Local version
         try:
-            with open(release_yaml, "r") as f:
-                info = yaml.safe_load(f) or {}
-            local_version = "v" + str(info.get("version", "")).strip()
-            if not local_version:
-                continue  # nothing to compare
+            local_version = "v" + _read_release_version(release_yaml)
         except Exception:
             continue
 
@@ -1640,40 +2052,74 @@ def guard_require_version_bump_for_src_packages():
         owner, repo = slug
 
         token = tokens.get(owner) or tokens.get("github.com") or None
-        latest = None
+        candidates.append((pkg_dir, package_name, local_version, owner, repo, token))
+
+    if not candidates:
+        return  # no package can be checked against a release
+
+    # Normalize tags in case tags are like "v1.2.3"
+    def norm(v):
+        return v[1:] if v.startswith("v") else v
+
+    def fetch_latest(candidate):
+        pkg_dir, _, local_version, owner, repo, token = candidate
         try:
-            latest = _get_latest_nonprerelease_release(owner, repo, token)
+            # A recently cached listing is enough to rule out a version match,
+            # unless release.yaml was edited after the listing was fetched
+            releases, from_cache = _fetch_release_listing(
+                owner,
+                repo,
+                token,
+                max_age=_RELEASE_CACHE_TTL,
+                not_before=os.stat(pkg_dir / "release.yaml").st_mtime,
+            )
+            latest = _latest_stable_release(releases)
+            if (
+                from_cache
+                and latest
+                and norm((latest.get("tag_name") or "").strip()) == norm(local_version)
+            ):
+                # Versions match in the cached copy: confirm with GitHub before
+                # comparing commits
+                latest = _get_latest_nonprerelease_release(owner, repo, token)
+            return latest
         except Exception:
             # If we cannot query, do not block setup; just continue.
-            continue
+            return None
 
+    # The release queries are network bound, so issue them concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_LOOKUP_WORKERS) as executor:
+        latest_releases = list(executor.map(fetch_latest, candidates))
+
+    # Only packages whose version equals the latest release need their git state
+    matches = []
+    for candidate, latest in zip(candidates, latest_releases):
         if not latest:
             continue
-
         latest_tag = (latest.get("tag_name") or "").strip()
+        if norm(latest_tag) != norm(candidate[2]):
+            continue  # versions differ → OK, no guard trips
+        matches.append((candidate, latest, latest_tag))
 
-        # Normalize tags in case tags are like "v1.2.3"
-        def norm(v):
-            return v[1:] if v.startswith("v") else v
+    if not matches:
+        return  # every local version differs from its latest release
 
-        if norm(latest_tag) != norm(local_version):
-            continue  # versions differ → OK, no guard trips
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_LOOKUP_WORKERS) as executor:
+        git_states = list(
+            executor.map(_git_head_and_dirty, [str(m[0][0]) for m in matches])
+        )
+
+    for (candidate, latest, latest_tag), (local_commit, dirty) in zip(
+        matches, git_states
+    ):
+        package_name, local_version = candidate[1:3]
 
         # Compare commits
         latest_commit_in_body = _extract_commit_from_body(latest.get("body") or "")
-        local_commit = get_commit_hash(str(pkg_dir))
-        dirty = _is_worktree_dirty(str(pkg_dir))
 
         if (latest_commit_in_body != local_commit) or (
             latest_commit_in_body == local_commit and dirty
         ):
-            # Build a helpful message for this package
-            details = []
-            details.append(f"version={local_version}")
-            details.append(f"latest_release_tag={latest_tag}")
-            details.append(f"release_commit={latest_commit_in_body or 'N/A'}")
-            details.append(f"local_commit={local_commit or 'N/A'}")
-            details.append(f"worktree_dirty={dirty}")
             violations.append(
                 {
                     "package": package_name,
@@ -1682,6 +2128,15 @@ def guard_require_version_bump_for_src_packages():
                     "release_commit": latest_commit_in_body or "N/A",
                     "local_commit": local_commit or "N/A",
                     "dirty": dirty,
+                    # table cells, with commits shortened to 10 chars for display
+                    "_row": (
+                        package_name,
+                        local_version,
+                        latest_tag,
+                        (latest_commit_in_body or "N/A")[:10],
+                        (local_commit or "N/A")[:10],
+                        str(dirty),
+                    ),
                 }
             )
 
@@ -1690,10 +2145,6 @@ def guard_require_version_bump_for_src_packages():
         BOLD = "\033[1m"
         RESET = Colors.RESET
 
-        def short_sha(s: Optional[str]) -> str:
-            s = s or "N/A"
-            return s[:10]
-
         title = f"{Colors.RED}{BOLD}❌ Version bump required before setup{RESET}"
         subtitle = (
             "Your local source version matches the latest stable release, "
@@ -1710,52 +2161,47 @@ def guard_require_version_bump_for_src_packages():
             "DIRTY",
         ]
 
-        def w(text):
-            return get_display_width(str(text))
+        def w(text: str) -> int:
+            return get_display_width(text)
+
+        rows = [row["_row"] for row in violations]
 
-        # compute column widths (use 10-char commit display)
+        # compute column widths
         col_widths = [w(h) for h in headers]
-        for row in violations:
-            col_widths[0] = max(col_widths[0], w(row["package"]))
-            col_widths[1] = max(col_widths[1], w(row["version"]))
-            col_widths[2] = max(col_widths[2], w(row["latest_tag"]))
-            col_widths[3] = max(col_widths[3], w(short_sha(row["release_commit"])))
-            col_widths[4] = max(col_widths[4], w(short_sha(row["local_commit"])))
-            col_widths[5] = max(col_widths[5], w(str(row["dirty"])))
+        for cells in rows:
+            for i, cell in enumerate(cells):
+                col_widths[i] = max(col_widths[i], w(cell))
+
+        # ASCII cells are as wide as they are long, so str.format can pad them
+        row_format = " | ".join(f"{{:<{width}}}" for width in col_widths)
 
         def fmt_row(vals):
-            cells = []
-            for i, v in enumerate(vals):
-                s = str(v)
-                pad = col_widths[i] - w(s)
-                cells.append(s + " " * pad)
-            return " | ".join(cells)
+            if all(v.isascii() for v in vals):
+                return row_format.format(*vals)
+            return " | ".join(
+                v + " " * (col_widths[i] - w(v)) for i, v in enumerate(vals)
+            )
 
         header_line = fmt_row(headers)
         sep = "-" * get_display_width(header_line)
 
-        body_lines = []
-        for row in violations:
-            body_lines.append(
-                fmt_row(
-                    [
-                        row["package"],
-                        row["version"],
-                        row["latest_tag"],
-                        short_sha(row["release_commit"]),
-                        short_sha(row["local_commit"]),
-                        row["dirty"],
-                    ]
-                )
-            )
-
-        msg = (
-            f"\n{title}\n"
-            f"{Colors.YELLOW}{subtitle}{RESET}\n\n"
-            f"{header_line}\n{sep}\n" + "\n".join(body_lines) + "\n"
+        body_lines = [fmt_row(cells) for cells in rows]
+
+        msg = "\n".join(
+            [
+                "",
+                title,
+                f"{Colors.YELLOW}{subtitle}{RESET}",
+                "",
+                header_line,
+                sep,
+                *body_lines,
+                "",
+                "",
+            ]
         )
 
-        print(msg)
+        sys.stdout.write(msg)
         sys.exit(1)
 
 
@@ -1771,14 +2217,20 @@ def setup(package_name="", build_type="", build_dir=""):
         src_dir = "src/" + package_name
         install_dir = f"release/install/{package_name}/{g.os_type}/{g.os_version}/{g.architecture}/{build_type}"
 
-    delete_directory(
-        os.path.join(g.script_directory, "generated")
-    )  # Delete the whole 'include' directory
-    delete_directory(Path(g.script_directory) / install_dir)
-    os.makedirs(Path(g.script_directory) / install_dir, exist_ok=True)
+    # Paths used throughout setup, built once
+    script_dir = g.script_directory
+    install_root = os.path.join(script_dir, install_dir)
+    generated_root = os.path.join(script_dir, "generated")
+    templates_root = os.path.join(script_dir, "templates")
+
+    _load_generated_manifest()
+    delete_directory(generated_root)  # Delete the whole 'include' directory
+    delete_directory(install_root)
+    _known_dirs.clear()  # the directories above were just removed
+    _ensure_dir(install_root)
 
     if build_dir:
-        os.makedirs(build_dir, exist_ok=True)
+        _ensure_dir(build_dir)
 
     packages_to_ignore = get_packages_to_ignore()
 
@@ -1789,20 +2241,43 @@ def setup(package_name="", build_type="", build_dir=""):
     )
 
     # Handle .action files
-    for action_file in action_files:
-        create_action_file(action_file, Path(action_file).parent.parent, install_dir)
+    # Interface generation is file I/O bound, so each kind is generated concurrently.
+    # The actions must finish first since they write the .msg/.srv files found below.
+    _make_interface_dirs(action_files, "action", install_dir)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        list(
+            executor.map(
+                lambda f: create_action_file(
+                    f, Path(f).parent.parent, install_dir, skip_mkdir=True
+                ),
+                action_files,
+            )
+        )
 
     msg_files, srv_files = find_interface_files(
         ["src", "temp"], ["msg", "srv"], packages_to_ignore
     )
 
-    # Handle .msg files
-    for msg_file in msg_files:
-        create_message_file(msg_file, Path(msg_file).parent.parent, install_dir)
-
-    # Handle .srv files
-    for srv_file in srv_files:
-        create_service_file(srv_file, Path(srv_file).parent.parent, install_dir)
+    # Handle .msg and .srv files. They don't depend on each other, so all of
+    # them are queued at once and the pool never idles between the two kinds.
+    _make_interface_dirs(msg_files, "msg", install_dir)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        list(
+            chain(
+                executor.map(
+                    lambda f: create_message_file(
+                        f, Path(f).parent.parent, install_dir, skip_mkdir=True
+                    ),
+                    msg_files,
+                ),
+                executor.map(
+                    lambda f: create_service_file(
+                        f, Path(f).parent.parent, install_dir
+                    ),
+                    srv_files,
+                ),
+            )
+        )
 
     # Update the CMakeLists.txt based on the template
     update_cmake_file(project_directories, build_dir)
@@ -1812,22 +2287,24 @@ def setup(package_name="", build_type="", build_dir=""):
     if package_name == "":  # this means we are not in the release mode
         copy_resource(install_dir)
 
-    os.makedirs(os.path.join(g.script_directory, "generated/include"), exist_ok=True)
-    shutil.copy(
-        os.path.join(g.script_directory, "templates", "raisin_serialization_base.hpp"),
-        os.path.join(g.script_directory, "generated/include"),
+    # copy raisin serialization base (the only copy made during setup)
+    generated_include_dir = os.path.join(generated_root, "include")
+    _ensure_dir(generated_include_dir)
+    shutil.copy2(
+        os.path.join(templates_root, "raisin_serialization_base.hpp"),
+        generated_include_dir,
     )
 
     # create release tag
-    install_release_file = Path(g.script_directory) / "install" / "release.txt"
+    install_release_file = os.path.join(script_dir, "install", "release.txt")
 
     # Read existing data if the file already exists.
     existing_data = read_existing_data(install_release_file)
-    output_file = Path(g.script_directory) / install_dir / "release.txt"
+    output_file = os.path.join(install_root, "release.txt")
 
     # Find Git repositories under the base directory.
-    git_repos = find_git_repos(g.script_directory + "/src")
-    git_repos.append(g.script_directory)
+    git_repos = find_git_repos(os.path.join(script_dir, "src"))
+    git_repos.append(script_dir)
     new_data = {}
 
     if not git_repos:
@@ -1849,29 +2326,19 @@ def setup(package_name="", build_type="", build_dir=""):
     write_data(output_file, merged_data)
     print(f"💾 Wrote git hash file: {output_file}")
 
-    # copy raisin serialization base
-    src_file = os.path.join(
-        g.script_directory, "templates", "raisin_serialization_base.hpp"
-    )
-    dest_dir = os.path.join(g.script_directory, "generated", "include")
-
-    os.makedirs(dest_dir, exist_ok=True)  # Ensure destination directory exists
-    shutil.copy2(src_file, dest_dir)
+    _ensure_dir(os.path.join(script_dir, "install"))
 
-    os.makedirs(Path(g.script_directory) / "install", exist_ok=True)
+    _save_generated_manifest()
 
     # install generated files
-    shutil.copytree(
-        Path(g.script_directory) / "generated",
-        Path(g.script_directory) / install_dir / "generated",
-        dirs_exist_ok=True,
-    )
+    _link_tree(generated_root, os.path.join(install_root, "generated"))
 
     deploy_install_packages()
 
-    shutil.copy2(
-        Path(g.script_directory) / "templates/install_dependencies.sh",
-        Path(g.script_directory) / "install/install_dependencies.sh",
+    # A deployed package may have linked its own installer to this path
+    _copy_replacing(
+        os.path.join(templates_root, "install_dependencies.sh"),
+        os.path.join(script_dir, "install", "install_dependencies.sh"),
     )
 
     collect_src_vcpkg_dependencies()
@@ -1885,29 +2352,158 @@ def _repo_slug_from_cfg(
     info = repositories.get(package_name)
     if not info or "url" not in info:
         return None
-    m = re.search(r"git@github\.com:(.*?)/(.*?)\.git", info["url"])
+    m = _GH_SSH_RE.search(info["url"]) or _GH_HTTPS_RE.match(info["url"])
     if not m:
         return None
     return m.group(1), m.group(2)
 
 
-def _get_latest_nonprerelease_release(
-    owner: str, repo: str, token: Optional[str]
-) -> Optional[Dict[str, Any]]:
+# Prefer orjson for decoding release listings when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Shared by every release lookup so connections to api.github.com are reused
+_GH_SESSION = requests.Session()
+_GH_SESSION.headers["Accept"] = "application/vnd.github.v3+json"
+_GH_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+
+
+# ETag-validated copies of release listings, keyed by "owner/repo"
+_release_cache: Optional[Dict[str, Any]] = None
+# Seconds a cached listing may be used without asking GitHub, when allowed.
+# Within this window a release published elsewhere goes unseen, so a package
+# whose cached latest tag differs from release.yaml skips the version-bump
+# check; editing release.yaml invalidates the cached listing for that package.
+_RELEASE_CACHE_TTL = 600
+_release_cache_lock = threading.Lock()
+
+
+def _release_cache_path() -> Path:
+    return Path(g.script_directory) / ".raisin_cache" / "releases.json"
+
+
+def _load_release_cache() -> Dict[str, Any]:
     """
-    Return the latest *non-prerelease* GitHub release object (dict) or None.
+    Load the release cache from disk on first use. Call with _release_cache_lock held.
     """
-    session = requests.Session()
-    headers = {"Accept": "application/vnd.github.v3+json"}
+    global _release_cache
+    if _release_cache is None:
+        try:
+            _release_cache = _json_loads(_release_cache_path().read_bytes())
+        except (OSError, ValueError):
+            _release_cache = {}
+    return _release_cache
+
+
+def _store_release_cache(slug: str, etag: str, releases: List[Dict[str, Any]]):
+    """
+    Remember the fields of a release listing we use, and persist the cache.
+    """
+    entry = {
+        "etag": etag,
+        "fetched_at": time.time(),
+        "releases": [
+            {
+                "tag_name": r.get("tag_name"),
+                "prerelease": r.get("prerelease"),
+                "body": r.get("body"),
+            }
+            for r in releases
+        ],
+    }
+    with _release_cache_lock:
+        cache = _load_release_cache()
+        cache[slug] = entry
+        try:
+            path = _release_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(cache))
+        except OSError:
+            pass  # The cache is only an optimization
+
+
+def _fetch_release_listing(
+    owner: str,
+    repo: str,
+    token: Optional[str],
+    session: Optional[requests.Session] = None,
+    max_age: Optional[float] = None,
+    not_before: float = 0,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Return (releases, from_cache) for owner/repo. Uses the shared _GH_SESSION
+    unless a session is given. With max_age, a cached listing fetched less than
+    max_age seconds ago, and no earlier than the not_before timestamp, is
+    returned without contacting GitHub, and from_cache is True.
+    """
+    session = session or _GH_SESSION
+    slug = f"{owner}/{repo}"
+    headers = {}
     if token:
         headers["Authorization"] = f"token {token}"
+
+    with _release_cache_lock:
+        cached = _load_release_cache().get(slug)
+
+    if (
+        cached
+        and max_age is not None
+        and cached.get("fetched_at", 0) >= not_before
+        and time.time() - cached.get("fetched_at", 0) < max_age
+    ):
+        return cached["releases"], True
+
+    # Revalidate a cached listing; a 304 has no body and is not rate limited
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+
     resp = session.get(
         f"https://api.github.com/repos/{owner}/{repo}/releases",
         headers=headers,
         timeout=15,
     )
-    resp.raise_for_status()
-    releases = resp.json()
+    if resp.status_code == 304 and cached:
+        releases = cached["releases"]
+        _store_release_cache(slug, cached["etag"], releases)  # still fresh
+    else:
+        resp.raise_for_status()
+        releases = _json_loads(resp.content)
+        etag = resp.headers.get("ETag")
+        if etag:
+            _store_release_cache(slug, etag, releases)
+    return releases, False
+
+
+def _get_latest_nonprerelease_release(
+    owner: str,
+    repo: str,
+    token: Optional[str],
+    session: Optional[requests.Session] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the latest *non-prerelease* GitHub release object (dict) or None.
+    The listing is always revalidated with GitHub.
+    """
+    releases, _ = _fetch_release_listing(owner, repo, token, session)
+    return _latest_stable_release(releases)
+
+
+def _latest_stable_release(
+    releases: List[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the release with the greatest tag among the non-prereleases, or None.
+    """
     # Sort by created_at desc and filter prerelease==False
     stable = [r for r in releases if not r.get("prerelease")]
     if not stable:
@@ -1920,8 +2516,18 @@ def _get_latest_nonprerelease_release(
         except Exception:
             return parse_version("0.0.0")
 
-    stable.sort(key=tag_key, reverse=True)
-    return stable[0]
+    # Plain "vX.Y.Z" tags order the same as integer tuples, which are much cheaper
+    # to build; anything else is compared with packaging's Version instead
+    keys = []
+    for r in stable:
+        m = _SEMVER_TAG_RE.match(r.get("tag_name") or "")
+        if not m:
+            keys = [tag_key(r) for r in stable]
+            break
+        keys.append((int(m.group(1)), int(m.group(2)), int(m.group(3))))
+
+    # max() keeps the first of equal tags, as the stable descending sort did
+    return stable[max(range(len(stable)), key=keys.__getitem__)]
 
 
 def _extract_commit_from_body(body: str) -> Optional[str]:
@@ -1930,16 +2536,47 @@ def _extract_commit_from_body(body: str) -> Optional[str]:
     """
     if not body:
         return None
-    # Prefer full sha-1 first
-    m = re.search(r"\b[0-9a-f]{40}\b", body, re.IGNORECASE)
-    if m:
-        return m.group(0)
-    # else allow short SHAs (>=7 chars)
-    m = re.search(r"\b[0-9a-f]{7,40}\b", body, re.IGNORECASE)
-    return m.group(0) if m else None
+    # One pass: return the first full sha-1, else the first short SHA (>=7 chars)
+    first = None
+    for m in _SHA_RE.finditer(body):
+        sha = m.group(0)
+        if len(sha) == 40:
+            return sha
+        if first is None:
+            first = sha
+    return first
+
+
+def _git_head_and_dirty(repo_path: str) -> Tuple[Optional[str], bool]:
+    """
+    Return (HEAD commit, worktree dirty) for repo_path from a single
+    `git status --porcelain=v2 --branch` call.
+    """
+    try:
+        out = subprocess.run(
+            ["git", "-C", repo_path, "status", "--porcelain=v2", "--branch"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(
+            f"❌ Error getting git status for {repo_path}:\n{getattr(e, 'stderr', e)}"
+        )
+        return None, False
+
+    head = None
+    dirty = False
+    for line in out.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid ") :]
+            head = None if oid == "(initial)" else oid
+        elif not line.startswith("#"):
+            # Any changed, unmerged or untracked entry
+            dirty = True
+    return head, dirty
 
 
 def _is_worktree_dirty(repo_path: str) -> bool:
     """True if there are uncommitted changes in repo_path."""
-    out = _run_git_command(["git", "status", "--porcelain"], repo_path)
-    return bool(out)
+    return _git_head_and_dirty(repo_path)[1]
@@ -6,15 +6,72 @@ Shared utilities used across multiple command modules.
 
 import os
 import sys
+import copy
 import yaml
 import shutil
 import platform
+import functools
+import threading
 from pathlib import Path
+from collections import OrderedDict
 from typing import Dict, Tuple
 
 # Import globals
 from commands import globals as g
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed YAML files, keyed by (path, all_documents) -> (mtime_ns, size, data)
+_yaml_cache = OrderedDict()
+_YAML_CACHE_SIZE = 100
+_yaml_cache_lock = threading.Lock()
+
+
+def yaml_load(stream):
+    """
+    yaml.safe_load using the libyaml-backed loader when it is available.
+    """
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+def load_yaml(path, all_documents=False):
+    """
+    Parse a YAML file, reusing the previous result while the file's mtime and
+    size are unchanged.
+
+    Args:
+        path: Path to the YAML file
+        all_documents: Return a list of every '---' separated document
+            instead of only the first one
+
+    Returns:
+        A copy of the parsed data, so callers may modify it freely
+    """
+    st = os.stat(path)
+    key = (os.fspath(path), all_documents)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _yaml_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+    with open(path, "r", encoding="utf-8") as f:
+        if all_documents:
+            data = list(yaml.load_all(f, Loader=_YamlLoader))
+        else:
+            data = yaml_load(f)
+
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        _yaml_cache.move_to_end(key)
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return copy.deepcopy(data)
+
 
 def load_configuration():
     """
@@ -29,29 +86,26 @@ def load_configuration():
     # Load repositories from repositories.yaml
     all_repositories = {}
     repo_path = script_dir_path / "repositories.yaml"
-    if repo_path.is_file():
-        with open(repo_path, "r") as f:
-            repo_data = yaml.safe_load(f)
-            if repo_data:
-                all_repositories = repo_data
+    if os.path.isfile(repo_path):
+        repo_data = load_yaml(repo_path)
+        if repo_data:
+            all_repositories = repo_data
 
     tokens = {}
     user_type = None
     packages_to_ignore = []
 
-    if config_path.is_file():
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-            tokens = config.get("gh_tokens", {})
-            user_type = config.get("user_type")
-            packages_to_ignore = config.get("packages_to_ignore", [])
+    if os.path.isfile(config_path):
+        config = load_yaml(config_path)
+        tokens = config.get("gh_tokens", {})
+        user_type = config.get("user_type")
+        packages_to_ignore = config.get("packages_to_ignore", [])
     else:
         secrets_path = script_dir_path / "secrets.yaml"
-        if secrets_path.is_file():
-            with open(secrets_path, "r") as f:
-                secrets = yaml.safe_load(f)
-                tokens = secrets.get("gh_tokens", {})
-                user_type = secrets.get("user_type")
+        if os.path.isfile(secrets_path):
+            secrets = load_yaml(secrets_path)
+            tokens = secrets.get("gh_tokens", {})
+            user_type = secrets.get("user_type")
 
     # Validate user_type
     if user_type is None:
@@ -90,10 +144,12 @@ def is_root():
     return os.geteuid() == 0
 
 
-def _read_os_release() -> Dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def read_os_release() -> Dict[str, str]:
     """
     Best-effort reader for Linux /etc/os-release. Uses platform.freedesktop_os_release()
     when available; falls back to parsing the file manually. Returns {} on failure.
+    The file is parsed once per process; treat the returned dict as read-only.
 
     Returns:
         Dict[str, str]: Dictionary of OS release information
@@ -181,7 +237,7 @@ def get_os_info() -> Tuple[str, str, str, str, str, dict]:
     developer_env2 = dict()
 
     if system == "Linux":
-        osr = _read_os_release()
+        osr = read_os_release()
         os_type2 = (osr.get("ID") or "linux").lower()
         os_version2 = osr.get("VERSION_ID") or platform.release()
 